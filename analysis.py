@@ -72,7 +72,7 @@ def plot_execution_times_by_file(size: str, python_times: Dict[str, float], c_ti
     output_dir = os.path.join('analysis', f'analysis_{size}')
     os.makedirs(output_dir, exist_ok=True)
     
-    files = sorted(python_times.keys())
+    files = sorted(set(python_times) & set(c_times))
     x = np.arange(len(files))
     width = 0.35
     
@@ -12,14 +12,83 @@ import time
 import statistics
 import json
 import sys
+import shutil
+import pstats
+import operator
+from functools import reduce
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Tuple
 
 class PerformanceTest:
-    def __init__(self):
-        """Inicializa o teste de performance."""
+    # Algoritmos comparados, além do QuickSort de referência, em cada linguagem
+    # ('auto' e 'adaptativo' são despachantes que escolhem um dos demais)
+    ALGORITHMS = {
+        "Python": ["radix", "counting", "auto", "adaptativo"],
+        "C": ["blocos", "radix", "counting", "auto"],
+    }
+    DISPATCHERS = ("auto", "adaptativo")
+    # Tamanho dos blocos lidos ao verificar as saídas (caracteres)
+    VERIFY_CHUNK_SIZE = 1 << 20
+    MASK_64 = (1 << 64) - 1
+    # Diretório dos perfis, ao lado dos logs, e quantidade de funções no resumo
+    PROFILE_DIR = os.path.join("log", "perfil")
+    PROFILE_TOP = 5
+    # Variantes de compilação do quicksort.c: nome -> (compilador, flags, usa PGO)
+    BUILD_DIR = "build"
+    BUILD_VARIANTS = {
+        "gcc-O0": ("gcc", ["-O0"], False),
+        "gcc-O2": ("gcc", ["-O2"], False),
+        "gcc-O3": ("gcc", ["-O3"], False),
+        "gcc-O3-native": ("gcc", ["-O3", "-march=native"], False),
+        "gcc-O3-lto": ("gcc", ["-O3", "-flto"], False),
+        "clang-O3": ("clang", ["-O3"], False),
+        "gcc-O3-pgo": ("gcc", ["-O3"], True),
+    }
+    # Binário de referência ("C" no relatório): mesmas flags do Makefile
+    REFERENCE_BUILD = ["gcc", "-Wall", "-O2", "quicksort.c", "-o", "quicksort"]
+    # Binário do perfil: flags da referência mais símbolos e frame pointers
+    PROFILE_BUILD = REFERENCE_BUILD[:3] + ["-g", "-fno-omit-frame-pointer", "quicksort.c", "-o", "quicksort_perfil"]
+    # Entrada gerada para treinar o build PGO
+    PGO_TRAINING_FILE = "treino_pgo.txt"
+    PGO_TRAINING_SIZE = 200_000
+
+    def __init__(self, profile: bool = False, variants: List[str] = None):
+        """
+        Inicializa o teste de performance.
+        
+        Args:
+            profile: Se True, cada arquivo também é executado sob perfiladores
+                (cProfile/py-spy para Python, perf para C)
+            variants: Variantes de compilação a comparar (nomes de
+                BUILD_VARIANTS); None usa todas e uma lista vazia desativa a matriz
+        """
         self.python_results: Dict[str, Dict[str, float]] = {}
         self.c_results: Dict[str, Dict[str, float]] = {}
+        # arquivo -> linguagem -> algoritmo -> tempo do algoritmo (ms)
+        self.algorithm_results: Dict[str, Dict[str, Dict[str, float]]] = {}
+        # arquivo -> linguagem -> despachante -> algoritmo escolhido
+        self.auto_choices: Dict[str, Dict[str, Dict[str, str]]] = {}
+        # arquivo -> resultado da sonda de pré-ordenação do modo 'adaptativo'
+        self.probe_results: Dict[str, str] = {}
+        # arquivo -> execução ('Python', 'C', 'C / radix'...) -> motivo da invalidação
+        self.invalid_runs: Dict[str, Dict[str, str]] = {}
+        # arquivo de entrada -> impressão digital (calculada uma vez por arquivo)
+        self.input_fingerprints: Dict[str, Dict[str, int]] = {}
+        # arquivo -> implementação -> [(função, % do tempo próprio)]
+        self.profile_summaries: Dict[str, Dict[str, List[Tuple[str, float]]]] = {}
+        # arquivo -> implementação -> motivo da falha da execução perfilada
+        self.profile_failures: Dict[str, Dict[str, str]] = {}
+        self.profile = profile
+        self.perf_cmd = shutil.which("perf")
+        self.sampler_cmd = shutil.which("py-spy")
+        self.variants = list(self.BUILD_VARIANTS) if variants is None else variants
+        # variante -> binário compilado, comando usado e motivo de indisponibilidade
+        self.variant_binaries: Dict[str, str] = {}
+        self.variant_commands: Dict[str, str] = {}
+        self.unavailable_variants: Dict[str, str] = {}
+        # arquivo -> variante -> tempos de execução
+        self.variant_results: Dict[str, Dict[str, Dict[str, float]]] = {}
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Verifica se os arquivos necessários existem
@@ -38,7 +107,7 @@ class PerformanceTest:
         
         # Compila o código C
         try:
-            subprocess.run(["gcc", "quicksort.c", "-o", "quicksort"], check=True)
+            subprocess.run(self.REFERENCE_BUILD, check=True)
             print("Código C compilado com sucesso!")
         except subprocess.CalledProcessError:
             print("Erro ao compilar o código C!")
@@ -46,6 +115,110 @@ class PerformanceTest:
         except FileNotFoundError:
             print("Erro: GCC não encontrado! Certifique-se de que o compilador C está instalado.")
             exit(1)
+        
+        # Binário com símbolos e frame pointers para o perf reconstruir as pilhas
+        if self.profile:
+            os.makedirs(self.PROFILE_DIR, exist_ok=True)
+            try:
+                subprocess.run(self.PROFILE_BUILD, check=True)
+            except subprocess.CalledProcessError:
+                print("Erro ao compilar o código C para o perfil!")
+                exit(1)
+        
+        self.build_variants()
+
+    def build_variants(self) -> None:
+        """
+        Compila cada variante selecionada em BUILD_DIR. Variantes cujo
+        compilador não existe ou cuja compilação falha são registradas como
+        indisponíveis em vez de interromper os testes.
+        """
+        for name in self.variants:
+            if name not in self.BUILD_VARIANTS:
+                print(f"Aviso: variante de compilação '{name}' desconhecida")
+                continue
+            compiler, flags, pgo = self.BUILD_VARIANTS[name]
+            if not shutil.which(compiler):
+                self.unavailable_variants[name] = f"{compiler} não encontrado"
+                continue
+            
+            os.makedirs(self.BUILD_DIR, exist_ok=True)
+            binary = os.path.join(self.BUILD_DIR, f"quicksort_{name}")
+            try:
+                if pgo:
+                    command = self._build_pgo(compiler, flags, binary)
+                else:
+                    command = [compiler, *flags, "quicksort.c", "-o", binary]
+                    subprocess.run(command, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                self.unavailable_variants[name] = f"falha na compilação ({e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e})"
+                continue
+            self.variant_binaries[name] = binary
+            self.variant_commands[name] = " ".join(command)
+        
+        if self.variant_binaries:
+            print(f"Variantes de compilação: {', '.join(self.variant_binaries)}")
+
+    def _build_pgo(self, compiler: str, flags: List[str], binary: str) -> List[str]:
+        """
+        Compila uma variante com PGO em duas etapas: gera um binário
+        instrumentado, executa-o sobre uma entrada gerada por
+        input_generator.gerar_numeros e recompila usando o perfil coletado.
+        
+        Args:
+            compiler: Compilador
+            flags: Flags de otimização
+            binary: Caminho do binário final
+            
+        Returns:
+            List[str]: Todas as etapas (compilação e ligação instrumentadas,
+            execuções de treino, compilação com o perfil e ligação final),
+            unidas por '&&', seguidas da descrição da entrada de treino
+            
+        Raises:
+            subprocess.CalledProcessError: Se alguma etapa falhar
+        """
+        from input_generator import gerar_numeros
+        
+        profile_dir = os.path.abspath(os.path.join(self.BUILD_DIR, "pgo_dados"))
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        obj = f"{binary}.o"
+        steps = [
+            [compiler, *flags, f"-fprofile-generate={profile_dir}", "-c", "quicksort.c", "-o", obj],
+            [compiler, f"-fprofile-generate={profile_dir}", obj, "-o", binary],
+        ]
+        for step in steps:
+            subprocess.run(step, capture_output=True, text=True, check=True)
+        
+        # Treina com uma entrada gerada, fora do padrão entrada_*.txt dos testes
+        os.makedirs("input", exist_ok=True)
+        os.makedirs("output", exist_ok=True)
+        training_input = os.path.join("input", self.PGO_TRAINING_FILE)
+        with open(training_input, "w") as f:
+            f.write(",".join(map(str, gerar_numeros(self.PGO_TRAINING_SIZE))))
+        try:
+            for algorithm in ("quicksort", "auto"):
+                steps.append([f"./{binary}", self.PGO_TRAINING_FILE, algorithm])
+                subprocess.run(steps[-1], capture_output=True, text=True, check=True)
+        finally:
+            os.remove(training_input)
+            training_output = self.get_output_path(self.PGO_TRAINING_FILE)
+            if os.path.exists(training_output):
+                os.remove(training_output)
+        
+        final_steps = [
+            [compiler, *flags, f"-fprofile-use={profile_dir}", "-fprofile-correction",
+             "-c", "quicksort.c", "-o", obj],
+            [compiler, obj, "-o", binary],
+        ]
+        for step in final_steps:
+            subprocess.run(step, capture_output=True, text=True, check=True)
+            steps.append(step)
+        os.remove(obj)
+        command = [*steps[0]]
+        for step in steps[1:]:
+            command += ["&&", *step]
+        return [*command, f"(treino: {self.PGO_TRAINING_SIZE} números gerados em input/{self.PGO_TRAINING_FILE})"]
 
     def _get_python_command(self) -> str:
         """
@@ -113,7 +286,7 @@ class PerformanceTest:
             try:
                 if "Leitura do arquivo:" in line:
                     times["leitura"] = float(line.split(":")[1].strip().split()[0])
-                elif "Algoritmo QuickSort:" in line:
+                elif line.startswith("Algoritmo ") and "escolhido" not in line:
                     times["algoritmo"] = float(line.split(":")[1].strip().split()[0])
                 elif "Escrita do arquivo:" in line:
                     times["escrita"] = float(line.split(":")[1].strip().split()[0])
@@ -124,51 +297,473 @@ class PerformanceTest:
                 
         return times
 
-    def run_python_quicksort(self, input_file: str) -> Dict[str, float]:
+    def extract_probe_from_output(self, output: str) -> str:
         """
-        Executa o QuickSort em Python para um arquivo de entrada.
+        Extrai o resultado da sonda de pré-ordenação da saída do programa.
+        
+        Args:
+            output: Saída do programa
+            
+        Returns:
+            str: Medidas da sonda ou string vazia se não houver
+        """
+        for line in output.split('\n'):
+            if line.startswith("Sonda de pré-ordenação:"):
+                return line.split(":", 1)[1].strip()
+        return ""
+
+    def extract_choice_from_output(self, output: str) -> str:
+        """
+        Extrai o algoritmo escolhido pelo modo 'auto' da saída do programa.
+        
+        Args:
+            output: Saída do programa
+            
+        Returns:
+            str: Nome do algoritmo escolhido ou string vazia se não houver
+        """
+        for line in output.split('\n'):
+            if line.startswith("Algoritmo escolhido:"):
+                return line.split(":", 1)[1].strip().split()[0]
+        return ""
+
+    def get_output_path(self, input_file: str) -> str:
+        """
+        Retorna o caminho do arquivo de saída gerado para uma entrada.
         
         Args:
             input_file: Nome do arquivo de entrada
             
         Returns:
-            Dict[str, float]: Dicionário com os tempos de execução
+            str: Caminho em output/ (nome da entrada + "_out.txt")
+        """
+        return os.path.join("output", f"{os.path.splitext(input_file)[0]}_out.txt")
+
+    def scan_numbers(self, path: str) -> Tuple[Dict[str, int], int]:
+        """
+        Percorre um arquivo de números uma única vez, em blocos, calculando sua
+        impressão digital e verificando se está em ordem não decrescente.
+        
+        A impressão digital independe da ordem dos elementos: contagem, soma,
+        xor e soma dos hashes (hash de tupla do CPython, determinístico para
+        inteiros), as três últimas módulo 2^64.
+        
+        Args:
+            path: Caminho do arquivo
+            
+        Returns:
+            Tuple[Dict[str, int], int]: Impressão digital e posição do primeiro
+            elemento fora de ordem (-1 se o arquivo estiver ordenado)
+            
+        Raises:
+            ValueError: Se o arquivo contiver dados em formato inválido
+        """
+        fingerprint = {"contagem": 0, "soma": 0, "xor": 0, "hash": 0}
+        first_unsorted = -1
+        previous = None
+        
+        def process(values: List[int]) -> None:
+            nonlocal first_unsorted, previous
+            if not values:
+                return
+            if first_unsorted < 0:
+                if previous is not None and previous > values[0]:
+                    first_unsorted = fingerprint["contagem"]
+                elif not all(map(operator.le, values, islice(values, 1, None))):
+                    first_unsorted = fingerprint["contagem"] + next(
+                        i for i in range(1, len(values)) if values[i - 1] > values[i])
+            previous = values[-1]
+            fingerprint["contagem"] += len(values)
+            fingerprint["soma"] = (fingerprint["soma"] + sum(values)) & self.MASK_64
+            fingerprint["xor"] = (fingerprint["xor"] ^ reduce(operator.xor, values)) & self.MASK_64
+            fingerprint["hash"] = (fingerprint["hash"] + sum(map(hash, zip(values)))) & self.MASK_64
+        
+        rest = ""
+        with open(path, "r") as f:
+            while True:
+                chunk = f.read(self.VERIFY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunk = rest + chunk
+                cut = chunk.rfind(",")
+                if cut < 0:
+                    rest = chunk
+                    continue
+                rest = chunk[cut + 1:]
+                process(list(map(int, chunk[:cut].split(","))))
+        if rest.strip():
+            process([int(rest)])
+        elif fingerprint["contagem"]:
+            raise ValueError("vírgula sem número no final do arquivo")
+        
+        return fingerprint, first_unsorted
+
+    def verify_output(self, input_file: str) -> Tuple[bool, str]:
         """
+        Verifica se a saída gerada para uma entrada está ordenada e é uma
+        permutação da entrada, sem reordenar nada: a saída é lida uma única vez
+        e sua impressão digital é comparada à da entrada.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+            
+        Returns:
+            Tuple[bool, str]: Se a saída é válida e, caso não seja, o motivo
+        """
+        output_path = self.get_output_path(input_file)
+        if not os.path.exists(output_path):
+            return False, "arquivo de saída ausente"
+        
+        try:
+            if input_file not in self.input_fingerprints:
+                self.input_fingerprints[input_file], _ = self.scan_numbers(os.path.join("input", input_file))
+            expected = self.input_fingerprints[input_file]
+            fingerprint, first_unsorted = self.scan_numbers(output_path)
+        except ValueError:
+            return False, "formato inválido na saída"
+        
+        if first_unsorted >= 0:
+            return False, f"saída fora de ordem na posição {first_unsorted}"
+        differences = [key for key in expected if expected[key] != fingerprint[key]]
+        if differences:
+            return False, f"saída não é permutação da entrada ({', '.join(differences)} diferente)"
+        return True, ""
+
+    def _run_program(self, command: List[str], language: str, input_file: str,
+                     label: str) -> Tuple[Dict[str, float], str]:
+        """
+        Executa uma implementação, extrai os tempos da sua saída e verifica o
+        arquivo gerado. Execuções com erro ou saída inválida são registradas em
+        invalid_runs e não entram nas estatísticas.
+        
+        Args:
+            command: Comando a ser executado
+            language: 'Python' ou 'C'
+            input_file: Nome do arquivo de entrada
+            label: Identificação da execução no relatório
+            
+        Returns:
+            Tuple[Dict[str, float], str]: Tempos de execução e saída do programa
+        """
+        self.remove_output(input_file)
         try:
             result = subprocess.run(
-                [self.python_cmd, "quicksort.py", input_file],
+                command,
                 capture_output=True,
                 text=True,
                 check=True
             )
-            return self.extract_times_from_output(result.stdout, "Python")
         except subprocess.CalledProcessError as e:
-            print(f"Erro ao executar QuickSort Python: {e}")
+            print(f"Erro ao executar QuickSort {language}: {e}")
             print(f"Saída de erro: {e.stderr}")
-            return {"leitura": 0.0, "algoritmo": 0.0, "escrita": 0.0, "total": 0.0}
+            self.invalid_runs.setdefault(input_file, {})[label] = "erro na execução"
+            return {"leitura": 0.0, "algoritmo": 0.0, "escrita": 0.0, "total": 0.0}, ""
+        
+        valid, reason = self.verify_output(input_file)
+        if not valid:
+            print(f"Execução inválida ({label}): {reason}")
+            self.invalid_runs.setdefault(input_file, {})[label] = reason
+        return self.extract_times_from_output(result.stdout, language), result.stdout
+
+    def is_valid(self, input_file: str, label: str) -> bool:
+        """
+        Indica se uma execução passou na verificação da saída.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+            label: Identificação da execução no relatório
+            
+        Returns:
+            bool: True se a execução é válida
+        """
+        return label not in self.invalid_runs.get(input_file, {})
+
+    def run_python_quicksort(self, input_file: str, algorithm: str = "python") -> Dict[str, float]:
+        """
+        Executa o QuickSort em Python para um arquivo de entrada.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+            algorithm: Backend do quicksort.py ('python', 'radix', 'counting', 'auto'...)
+            
+        Returns:
+            Dict[str, float]: Dicionário com os tempos de execução
+        """
+        label = "Python" if algorithm == "python" else f"Python / {algorithm}"
+        times, _ = self._run_program([self.python_cmd, "quicksort.py", input_file, algorithm],
+                                     "Python", input_file, label)
+        return times
 
-    def run_c_quicksort(self, input_file: str) -> Dict[str, float]:
+    def run_c_quicksort(self, input_file: str, algorithm: str = "quicksort") -> Dict[str, float]:
         """
         Executa o QuickSort em C para um arquivo de entrada.
         
         Args:
             input_file: Nome do arquivo de entrada
+            algorithm: Algoritmo do binário ('quicksort', 'radix', 'counting', 'auto')
             
         Returns:
             Dict[str, float]: Dicionário com os tempos de execução
         """
+        label = "C" if algorithm == "quicksort" else f"C / {algorithm}"
+        times, _ = self._run_program(["./quicksort", input_file, algorithm], "C", input_file, label)
+        return times
+
+    def run_algorithm_comparison(self, input_file: str) -> None:
+        """
+        Executa os algoritmos alternativos (radix, counting e despachantes) em
+        cada linguagem e registra o tempo do algoritmo e as escolhas feitas.
+        
+        O QuickSort de referência reaproveita os resultados já coletados.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+        """
+        self.algorithm_results[input_file] = {
+            "Python": {"quicksort": self.python_results[input_file]["algoritmo"]},
+            "C": {"quicksort": self.c_results[input_file]["algoritmo"]},
+        }
+        self.auto_choices[input_file] = {"Python": {}, "C": {}}
+        
+        for language, algorithms in self.ALGORITHMS.items():
+            for algorithm in algorithms:
+                if language == "Python":
+                    command = [self.python_cmd, "quicksort.py", input_file, algorithm]
+                else:
+                    command = ["./quicksort", input_file, algorithm]
+                times, output = self._run_program(command, language, input_file,
+                                                  f"{language} / {algorithm}")
+                self.algorithm_results[input_file][language][algorithm] = times["algoritmo"]
+                if algorithm in self.DISPATCHERS:
+                    self.auto_choices[input_file][language][algorithm] = self.extract_choice_from_output(output)
+                if algorithm == "adaptativo":
+                    self.probe_results[input_file] = self.extract_probe_from_output(output)
+
+    def run_build_variants(self, input_file: str) -> None:
+        """
+        Executa o QuickSort de cada variante de compilação para um arquivo.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+        """
+        self.variant_results[input_file] = {}
+        for name, binary in self.variant_binaries.items():
+            times, _ = self._run_program([f"./{binary}", input_file], "C", input_file, f"C [{name}]")
+            self.variant_results[input_file][name] = times
+
+    def collapse_cprofile(self, stats: pstats.Stats) -> Dict[str, float]:
+        """
+        Converte um perfil do cProfile em pilhas colapsadas (formato do flamegraph).
+        
+        O cProfile só registra pares chamador/chamado, então cada função recebe
+        a pilha formada pelo seu chamador principal (o de maior tempo
+        acumulado), subindo até uma função sem chamadores. É uma aproximação,
+        mas suficiente para ver onde o tempo próprio se concentra.
+        
+        Args:
+            stats: Perfil carregado
+            
+        Returns:
+            Dict[str, float]: Pilha ("raiz;...;função") -> tempo próprio em µs
+        """
+        def name(func: Tuple[str, int, str]) -> str:
+            return func[2] if func[0] == "~" else f"{os.path.basename(func[0])}:{func[2]}"
+        
+        collapsed: Dict[str, float] = {}
+        for func, (_, _, tottime, _, callers) in stats.stats.items():
+            if tottime <= 0:
+                continue
+            stack = [name(func)]
+            seen = {func}
+            current_callers = callers
+            while current_callers:
+                caller = max(current_callers, key=lambda c: current_callers[c][3])
+                if caller in seen:
+                    break
+                seen.add(caller)
+                stack.append(name(caller))
+                current_callers = stats.stats[caller][4] if caller in stats.stats else {}
+            key = ";".join(reversed(stack))
+            collapsed[key] = collapsed.get(key, 0.0) + tottime * 1_000_000
+        return collapsed
+
+    def collapse_perf_script(self, script: str) -> Dict[str, float]:
+        """
+        Converte a saída de 'perf script' em pilhas colapsadas, como o
+        stackcollapse-perf.pl do FlameGraph.
+        
+        Args:
+            script: Saída de 'perf script'
+            
+        Returns:
+            Dict[str, float]: Pilha ("raiz;...;função") -> número de amostras
+        """
+        collapsed: Dict[str, float] = {}
+        for event in script.split("\n\n"):
+            lines = [line.strip() for line in event.strip().split("\n")[1:] if line.strip()]
+            frames = []
+            for line in lines:
+                parts = line.split(None, 1)
+                if len(parts) < 2:
+                    continue
+                symbol = parts[1].rsplit(" (", 1)[0].split("+0x")[0]
+                frames.append(symbol)
+            if frames:
+                key = ";".join(reversed(frames))
+                collapsed[key] = collapsed.get(key, 0.0) + 1
+        return collapsed
+
+    def write_collapsed(self, collapsed: Dict[str, float], path: str) -> None:
+        """
+        Salva pilhas colapsadas em um arquivo (uma pilha e seu peso por linha),
+        pronto para flamegraph.pl, speedscope ou inferno.
+        
+        Args:
+            collapsed: Pilha -> peso
+            path: Caminho do arquivo
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, weight in sorted(collapsed.items()):
+                f.write(f"{stack} {int(round(weight))}\n")
+
+    def summarize_collapsed(self, collapsed: Dict[str, float]) -> List[Tuple[str, float]]:
+        """
+        Resume pilhas colapsadas nas funções com mais tempo próprio.
+        
+        Args:
+            collapsed: Pilha -> peso
+            
+        Returns:
+            List[Tuple[str, float]]: (função, % do total) das PROFILE_TOP mais quentes
+        """
+        self_weights: Dict[str, float] = {}
+        for stack, weight in collapsed.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            self_weights[leaf] = self_weights.get(leaf, 0.0) + weight
+        total = sum(self_weights.values())
+        if total <= 0:
+            return []
+        hottest = sorted(self_weights.items(), key=lambda item: item[1], reverse=True)[:self.PROFILE_TOP]
+        return [(func, 100.0 * weight / total) for func, weight in hottest]
+
+    def check_profiled_run(self, input_file: str, language: str, output: str) -> bool:
+        """
+        Verifica uma execução perfilada como as execuções cronometradas. O
+        'python -m cProfile' encerra com status 0 mesmo quando o script sai com
+        erro, então a saída do programa e o arquivo gerado são conferidos; em
+        caso de falha o motivo fica em profile_failures.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+            language: 'Python' ou 'C'
+            output: Saída do programa perfilado
+            
+        Returns:
+            bool: True se a execução terminou e gerou uma saída válida
+        """
+        errors = [line.strip() for line in output.split('\n') if line.startswith("Erro:")]
+        if errors:
+            reason = errors[0]
+        else:
+            valid, reason = self.verify_output(input_file)
+            if valid:
+                return True
+        print(f"Perfil inválido ({language}): {reason}")
+        self.profile_failures.setdefault(input_file, {})[language] = reason
+        return False
+
+    def remove_output(self, input_file: str) -> None:
+        """
+        Remove a saída anterior de uma entrada, para que uma execução com erro
+        não seja verificada contra o resultado de outra implementação.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+        """
+        output_path = self.get_output_path(input_file)
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+    def profile_python(self, input_file: str) -> List[Tuple[str, float]]:
+        """
+        Executa o quicksort.py sob o cProfile (e sob o py-spy, se instalado),
+        salvando o perfil e as pilhas colapsadas em PROFILE_DIR.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+            
+        Returns:
+            List[Tuple[str, float]]: Funções mais quentes e % do tempo próprio
+        """
+        base = os.path.join(self.PROFILE_DIR, f"{os.path.splitext(input_file)[0]}_python")
+        self.remove_output(input_file)
         try:
-            result = subprocess.run(
-                ["./quicksort", input_file],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return self.extract_times_from_output(result.stdout, "C")
+            result = subprocess.run([self.python_cmd, "-m", "cProfile", "-o", f"{base}.prof",
+                                     "quicksort.py", input_file],
+                                    capture_output=True, text=True, check=True)
         except subprocess.CalledProcessError as e:
-            print(f"Erro ao executar QuickSort C: {e}")
-            print(f"Saída de erro: {e.stderr}")
-            return {"leitura": 0.0, "algoritmo": 0.0, "escrita": 0.0, "total": 0.0}
+            print(f"Erro ao perfilar QuickSort Python: {e}")
+            self.profile_failures.setdefault(input_file, {})["Python"] = "erro na execução"
+            return []
+        if not self.check_profiled_run(input_file, "Python", result.stdout):
+            return []
+        
+        collapsed = self.collapse_cprofile(pstats.Stats(f"{base}.prof"))
+        self.write_collapsed(collapsed, f"{base}.collapsed")
+        
+        # Perfil por amostragem: pilhas completas, sem o custo de instrumentação
+        if self.sampler_cmd:
+            try:
+                subprocess.run([self.sampler_cmd, "record", "-f", "raw", "-o", f"{base}_amostras.collapsed",
+                                "--", self.python_cmd, "quicksort.py", input_file],
+                               capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                print(f"Aviso: py-spy falhou ({e}); mantendo apenas o cProfile")
+        return self.summarize_collapsed(collapsed)
+
+    def profile_c(self, input_file: str) -> List[Tuple[str, float]]:
+        """
+        Executa o binário C sob 'perf record -g', se o perf estiver disponível,
+        salvando os dados e as pilhas colapsadas em PROFILE_DIR.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+            
+        Returns:
+            List[Tuple[str, float]]: Funções mais quentes e % das amostras
+        """
+        if not self.perf_cmd:
+            return []
+        base = os.path.join(self.PROFILE_DIR, f"{os.path.splitext(input_file)[0]}_c")
+        self.remove_output(input_file)
+        try:
+            result = subprocess.run([self.perf_cmd, "record", "-g", "-o", f"{base}.perf.data",
+                                     "./quicksort_perfil", input_file],
+                                    capture_output=True, text=True, check=True)
+            if not self.check_profiled_run(input_file, "C", result.stdout):
+                return []
+            script = subprocess.run([self.perf_cmd, "script", "-i", f"{base}.perf.data"],
+                                    capture_output=True, text=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            print(f"Aviso: perf falhou ({e}); perfil C ignorado")
+            return []
+        
+        collapsed = self.collapse_perf_script(script)
+        self.write_collapsed(collapsed, f"{base}.collapsed")
+        return self.summarize_collapsed(collapsed)
+
+    def run_profiles(self, input_file: str) -> None:
+        """
+        Gera os perfis das implementações para um arquivo de entrada. Os perfis
+        são execuções separadas e não afetam os tempos medidos.
+        
+        Args:
+            input_file: Nome do arquivo de entrada
+        """
+        self.profile_summaries[input_file] = {
+            "Python": self.profile_python(input_file),
+            "C": self.profile_c(input_file),
+        }
 
     def calculate_statistics(self, times: List[float]) -> Dict[str, float]:
         """
@@ -217,6 +812,7 @@ class PerformanceTest:
         report.append("-" * 80)
         report.append(f"Sistema Operacional: {sys.platform}")
         report.append(f"Comando Python: {self.python_cmd}")
+        report.append(f"Compilação C de referência: {' '.join(self.REFERENCE_BUILD)}")
         
         report.append("\nRESULTADOS POR ARQUIVO:")
         report.append("-" * 80)
@@ -226,20 +822,43 @@ class PerformanceTest:
             report.append(f"\nArquivo: {input_file}")
             python_ms = self.python_results[input_file]['total']
             c_ms = self.c_results[input_file]['total']
-            report.append(f"Python: {python_ms:.6f} ms")
-            report.append(f"C: {c_ms:.6f} ms")
-            if c_ms > 0:
+            python_valid = self.is_valid(input_file, "Python")
+            c_valid = self.is_valid(input_file, "C")
+            if python_valid:
+                report.append(f"Python: {python_ms:.6f} ms")
+            else:
+                report.append(f"Python: INVÁLIDO ({self.invalid_runs[input_file]['Python']})")
+            if c_valid:
+                report.append(f"C: {c_ms:.6f} ms")
+            else:
+                report.append(f"C: INVÁLIDO ({self.invalid_runs[input_file]['C']})")
+            if not (python_valid and c_valid):
+                report.append("Speedup (Python/C): N/A (execução inválida)")
+            elif c_ms > 0:
                 speedup = python_ms / c_ms
                 report.append(f"Speedup (Python/C): {speedup:.6f}x")
             else:
                 report.append("Speedup (Python/C): N/A (erro na execução)")
         
+        report.extend(self.generate_verification_report())
+        
+        if self.algorithm_results:
+            report.extend(self.generate_algorithm_report())
+        
+        if self.variant_results or self.unavailable_variants:
+            report.extend(self.generate_variant_report())
+        
+        if self.profile_summaries:
+            report.extend(self.generate_profile_report())
+        
         # Estatísticas gerais
         report.append("\nESTATÍSTICAS GERAIS:")
         report.append("-" * 80)
         
-        python_times = [result['total'] for result in self.python_results.values()]
-        c_times = [result['total'] for result in self.c_results.values()]
+        python_times = [result['total'] for input_file, result in self.python_results.items()
+                        if self.is_valid(input_file, "Python")]
+        c_times = [result['total'] for input_file, result in self.c_results.items()
+                   if self.is_valid(input_file, "C")]
         
         python_stats = self.calculate_statistics(python_times)
         c_stats = self.calculate_statistics(c_times)
@@ -262,6 +881,146 @@ class PerformanceTest:
         
         return "\n".join(report)
 
+    def generate_variant_report(self) -> List[str]:
+        """
+        Gera a seção do relatório que compara as variantes de compilação do C,
+        com o comando exato de cada uma e a mais rápida em tempo total médio.
+        
+        Returns:
+            List[str]: Linhas da seção
+        """
+        report = []
+        report.append("\nVARIANTES DE COMPILAÇÃO (QuickSort em C):")
+        report.append("-" * 80)
+        for name, command in self.variant_commands.items():
+            report.append(f"  {name} -> {command}")
+        for name, reason in self.unavailable_variants.items():
+            report.append(f"  {name} -> indisponível ({reason})")
+        
+        totals: Dict[str, List[float]] = {name: [] for name in self.variant_binaries}
+        algorithm_times: Dict[str, List[float]] = {name: [] for name in self.variant_binaries}
+        for input_file in sorted(self.variant_results.keys()):
+            report.append(f"\n{input_file}")
+            for name, times in self.variant_results[input_file].items():
+                label = f"C [{name}]"
+                if not self.is_valid(input_file, label):
+                    report.append(f"  {name}: INVÁLIDO ({self.invalid_runs[input_file][label]})")
+                    continue
+                totals[name].append(times["total"])
+                algorithm_times[name].append(times["algoritmo"])
+                report.append(f"  {name}: total {times['total']:.6f} ms, algoritmo {times['algoritmo']:.6f} ms")
+        
+        means = {name: statistics.mean(values) for name, values in totals.items() if values}
+        if means:
+            report.append("\nMédia por variante:")
+            for name in sorted(means, key=means.get):
+                report.append(f"  {name}: total {means[name]:.6f} ms, "
+                              f"algoritmo {statistics.mean(algorithm_times[name]):.6f} ms")
+            fastest = min(means, key=means.get)
+            report.append(f"Variante mais rápida -> {fastest} ({self.variant_commands[fastest]})")
+        return report
+
+    def generate_profile_report(self) -> List[str]:
+        """
+        Gera a seção do relatório com as funções mais quentes de cada perfil.
+        
+        Returns:
+            List[str]: Linhas da seção
+        """
+        report = []
+        report.append(f"\nPERFIL (funções com mais tempo próprio, arquivos em {self.PROFILE_DIR}/):")
+        report.append("-" * 80)
+        report.append(f"Compilação C do perfil: {' '.join(self.PROFILE_BUILD)}")
+        for input_file in sorted(self.profile_summaries.keys()):
+            report.append(f"\n{input_file}")
+            for language, hottest in self.profile_summaries[input_file].items():
+                failure = self.profile_failures.get(input_file, {}).get(language)
+                if failure:
+                    report.append(f"  {language} -> INVÁLIDO ({failure})")
+                    continue
+                if not hottest:
+                    reason = "perf não disponível" if language == "C" and not self.perf_cmd else "sem dados"
+                    report.append(f"  {language} -> N/A ({reason})")
+                    continue
+                summary = ", ".join(f"{func} {percent:.1f}%" for func, percent in hottest)
+                report.append(f"  {language} -> {summary}")
+        return report
+
+    def generate_verification_report(self) -> List[str]:
+        """
+        Gera a seção do relatório com o resultado da verificação das saídas.
+        
+        Returns:
+            List[str]: Linhas da seção
+        """
+        report = []
+        report.append("\nVERIFICAÇÃO DAS SAÍDAS (ordenação e impressão digital):")
+        report.append("-" * 80)
+        invalid = [(input_file, label, reason)
+                   for input_file, runs in sorted(self.invalid_runs.items())
+                   for label, reason in runs.items()]
+        report.append(f"Execuções inválidas: {len(invalid)}")
+        for input_file, label, reason in invalid:
+            report.append(f"  {input_file} / {label} -> {reason}")
+        return report
+
+    def generate_algorithm_report(self) -> List[str]:
+        """
+        Gera a seção do relatório que compara QuickSort, radix e counting sort.
+        
+        Para cada arquivo e linguagem mostra o tempo do algoritmo, o mais rápido
+        entre os algoritmos fixos e a escolha de cada despachante ('auto' e
+        'adaptativo'), junto com o resultado da sonda de pré-ordenação.
+        
+        Returns:
+            List[str]: Linhas da seção
+        """
+        report = []
+        report.append("\nCOMPARAÇÃO DE ALGORITMOS (tempo do algoritmo):")
+        report.append("-" * 80)
+        
+        wins: Dict[str, Dict[str, int]] = {}
+        hits: Dict[str, Dict[str, int]] = {}
+        comparable: Dict[str, Dict[str, int]] = {}
+        for input_file in sorted(self.algorithm_results.keys()):
+            report.append(f"\n{input_file}")
+            if self.probe_results.get(input_file):
+                report.append(f"  Sonda de pré-ordenação -> {self.probe_results[input_file]}")
+            for language, times in self.algorithm_results[input_file].items():
+                labels = {alg: language if alg == "quicksort" else f"{language} / {alg}" for alg in times}
+                fixed = {alg: t for alg, t in times.items()
+                         if alg not in self.DISPATCHERS and t > 0 and self.is_valid(input_file, labels[alg])}
+                for algorithm, value in times.items():
+                    if self.is_valid(input_file, labels[algorithm]):
+                        report.append(f"  {language} / {algorithm}: {value:.6f} ms")
+                    else:
+                        reason = self.invalid_runs[input_file][labels[algorithm]]
+                        report.append(f"  {language} / {algorithm}: INVÁLIDO ({reason})")
+                if not fixed:
+                    continue
+                winner = min(fixed, key=fixed.get)
+                wins.setdefault(language, {})
+                wins[language][winner] = wins[language].get(winner, 0) + 1
+                hits.setdefault(language, {})
+                comparable.setdefault(language, {})
+                choices = []
+                for dispatcher, choice in self.auto_choices[input_file][language].items():
+                    # Estratégias próprias do despachante (inserção, merge...) não
+                    # têm tempo fixo para comparar e ficam fora da taxa de acerto
+                    if choice in fixed:
+                        comparable[language][dispatcher] = comparable[language].get(dispatcher, 0) + 1
+                        hits[language][dispatcher] = hits[language].get(dispatcher, 0) + (1 if choice == winner else 0)
+                    choices.append(f"{dispatcher} -> {choice or 'N/A'}")
+                report.append(f"  Mais rápido ({language}) -> {winner}; escolhas: {', '.join(choices) or 'N/A'}")
+        
+        report.append("\nVitórias por algoritmo:")
+        for language, counts in wins.items():
+            summary = ", ".join(f"{alg}={count}" for alg, count in sorted(counts.items()))
+            accuracy = ", ".join(f"{dispatcher} acertou {hits[language][dispatcher]} de {count} escolhas comparáveis"
+                                 for dispatcher, count in comparable[language].items()) or "sem escolhas comparáveis"
+            report.append(f"  {language} -> {summary} ({accuracy})")
+        return report
+
     def run_tests(self):
         """Executa os testes de performance."""
         input_files = self.get_input_files()
@@ -290,6 +1049,13 @@ class PerformanceTest:
             # Reseta resultados para este tamanho
             self.python_results = {}
             self.c_results = {}
+            self.algorithm_results = {}
+            self.auto_choices = {}
+            self.probe_results = {}
+            self.invalid_runs = {}
+            self.profile_summaries = {}
+            self.profile_failures = {}
+            self.variant_results = {}
             
             # Executa testes para todos os arquivos deste tamanho
             for input_file in files:
@@ -302,6 +1068,18 @@ class PerformanceTest:
                 # Teste C
                 print("Executando QuickSort em C...")
                 self.c_results[input_file] = self.run_c_quicksort(input_file)
+                
+                # Algoritmos alternativos (radix, counting e escolha automática)
+                print("Executando radix, counting e despachantes (auto/adaptativo)...")
+                self.run_algorithm_comparison(input_file)
+                
+                if self.variant_binaries:
+                    print("Executando variantes de compilação do C...")
+                    self.run_build_variants(input_file)
+                
+                if self.profile:
+                    print("Gerando perfis...")
+                    self.run_profiles(input_file)
             
             # Gera e salva o relatório para este tamanho
             report = self.generate_report()
@@ -315,9 +1093,21 @@ class PerformanceTest:
         print("\nTodos os testes foram concluídos!")
 
 def main():
-    """Função principal do programa."""
+    """
+    Função principal do programa.
+    
+    Uso: python performance_test.py [--perfil] [--variantes=gcc-O2,gcc-O3,...]
+    Com --perfil, cada arquivo também é executado sob perfiladores e o
+    relatório inclui as funções mais quentes de cada implementação.
+    Com --variantes, apenas as variantes de compilação listadas são comparadas
+    (--variantes= sem nomes desativa a matriz); por padrão, todas.
+    """
+    variants = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--variantes="):
+            variants = [name for name in arg.split("=", 1)[1].split(",") if name]
     try:
-        tester = PerformanceTest()
+        tester = PerformanceTest(profile="--perfil" in sys.argv[1:], variants=variants)
         tester.run_tests()
     except Exception as e:
         print(f"Erro durante a execução dos testes: {str(e)}")
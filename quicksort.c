@@ -1,18 +1,50 @@
 /**
  * Implementação do algoritmo QuickSort em C.
  * Este código é equivalente à implementação em Python.
+ *
+ * Compilado com -DQUICKSORT_BIBLIOTECA (alvo libquicksort.so do Makefile),
+ * o arquivo gera uma biblioteca compartilhada sem a função main, cujas funções
+ * quicksort_ordenar_int32/int64 podem ser chamadas via ctypes pelo Python.
+ * Elas retornam 0 em caso de sucesso e -1 se o buffer tiver mais elementos
+ * do que os índices da ordenação comportam.
  */
 
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <stdint.h>
+#include <limits.h>
 #include <time.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 
 /* Protótipos das funções */
 void quicksort(int arr[], int low, int high);
+int partition_blocos(int arr[], int low, int high);
+void quicksort_blocos(int arr[], int low, int high);
 int partition(int arr[], int low, int high);
 void trocar(int* a, int* b);
-int contar_numeros(const char* filename);
+void quicksort_int64(int64_t arr[], long low, long high);
+long partition_int64(int64_t arr[], long low, long high);
+void mediana_de_tres_int64(int64_t arr[], long low, long high);
+int quicksort_ordenar_int32(int32_t* arr, size_t n);
+int quicksort_ordenar_int64(int64_t* arr, size_t n);
+void obter_intervalo(const int arr[], int n, int* minimo, int* maximo);
+void counting_sort(int arr[], int n, int minimo, int maximo);
+void radix_sort(int arr[], int n, int minimo, int maximo);
+const char* escolher_algoritmo(int n, int minimo, int maximo);
+const char* nome_algoritmo(const char* algoritmo);
+void ordenar(int arr[], int n, const char* algoritmo);
+void ordenar_automatico(int arr[], int n);
+void mediana_de_tres(int arr[], int low, int high);
+void introselect(int arr[], int low, int high, int k);
+void selecionar_varios(int arr[], int low, int high, const int ranks[], int nr);
+int nth_elemento(int arr[], int n, int k);
+void menores_k(int arr[], int n, int k, int ordenado);
+void quantis(int arr[], int n, const double qs[], int nq, int saida[]);
+int* ler_numeros(const char* caminho, int* quantidade);
 double obter_tempo_ms(void);
 char* gerar_nome_saida(const char* nome_entrada);
 char* gerar_caminho(const char* diretorio, const char* arquivo);
@@ -72,6 +104,596 @@ void quicksort(int arr[], int low, int high) {
     }
 }
 
+/* Tamanho dos blocos da partição BlockQuicksort (offsets cabem em um byte) */
+#define TAMANHO_BLOCO 128
+
+/* Abaixo deste tamanho quicksort_blocos termina por inserção */
+#define LIMIAR_INSERCAO_BLOCOS 16
+
+/**
+ * @brief Particiona o array em blocos, sem desvios na comparação (BlockQuicksort)
+ *
+ * O pivô é o último elemento, como em partition (quicksort_blocos o escolhe
+ * antes pela mediana de três). Em vez de um if por elemento, cada bloco de
+ * TAMANHO_BLOCO elementos de cada ponta é percorrido gravando os offsets dos
+ * elementos fora de lugar, com o resultado da comparação somado ao contador;
+ * depois os pares de elementos fora de lugar são trocados em lote. O trecho
+ * final, menor que dois blocos, é particionado da forma tradicional.
+ *
+ * @param arr Array a ser particionado
+ * @param low Índice inicial da partição
+ * @param high Índice final da partição (pivô)
+ * @return Posição final do pivô
+ */
+int partition_blocos(int arr[], int low, int high) {
+    unsigned char offsets_esq[TAMANHO_BLOCO];
+    unsigned char offsets_dir[TAMANHO_BLOCO];
+    int pivot = arr[high];
+    int l = low;
+    int r = high - 1;
+    int inicio_esq = 0, inicio_dir = 0;
+    int num_esq = 0, num_dir = 0;
+
+    while (r - l + 1 > 2 * TAMANHO_BLOCO) {
+        // Bloco da esquerda: elementos >= pivô devem ir para a direita
+        if (num_esq == 0) {
+            inicio_esq = 0;
+            for (int i = 0; i < TAMANHO_BLOCO; i++) {
+                offsets_esq[num_esq] = (unsigned char)i;
+                num_esq += (arr[l + i] >= pivot);
+            }
+        }
+        // Bloco da direita: elementos <= pivô devem ir para a esquerda
+        if (num_dir == 0) {
+            inicio_dir = 0;
+            for (int i = 0; i < TAMANHO_BLOCO; i++) {
+                offsets_dir[num_dir] = (unsigned char)i;
+                num_dir += (pivot >= arr[r - i]);
+            }
+        }
+
+        int num = num_esq < num_dir ? num_esq : num_dir;
+        for (int j = 0; j < num; j++) {
+            trocar(&arr[l + offsets_esq[inicio_esq + j]], &arr[r - offsets_dir[inicio_dir + j]]);
+        }
+
+        num_esq -= num;
+        num_dir -= num;
+        inicio_esq += num;
+        inicio_dir += num;
+        if (num_esq == 0) l += TAMANHO_BLOCO;
+        if (num_dir == 0) r -= TAMANHO_BLOCO;
+    }
+
+    // Tudo antes de l é <= pivô e tudo depois de r é >= pivô; o restante
+    // (incluindo um bloco com offsets pendentes) é particionado elemento a elemento
+    int i = l - 1;
+    for (int j = l; j <= r; j++) {
+        if (arr[j] < pivot) {
+            i++;
+            trocar(&arr[i], &arr[j]);
+        }
+    }
+    trocar(&arr[i + 1], &arr[high]);
+    return (i + 1);
+}
+
+/**
+ * @brief QuickSort com partição em blocos (BlockQuicksort)
+ *
+ * Usa a mediana de três como pivô e partition_blocos como partição.
+ * Recursão apenas na partição menor (pilha O(log n)) e ordenação por
+ * inserção nos trechos com até LIMIAR_INSERCAO_BLOCOS elementos.
+ *
+ * @param arr Array a ser ordenado
+ * @param low Índice inicial da partição
+ * @param high Índice final da partição
+ */
+void quicksort_blocos(int arr[], int low, int high) {
+    while (high - low + 1 > LIMIAR_INSERCAO_BLOCOS) {
+        mediana_de_tres(arr, low, high);
+        int pi = partition_blocos(arr, low, high);
+        if (pi - low < high - pi) {
+            quicksort_blocos(arr, low, pi - 1);
+            low = pi + 1;
+        } else {
+            quicksort_blocos(arr, pi + 1, high);
+            high = pi - 1;
+        }
+    }
+
+    for (int i = low + 1; i <= high; i++) {
+        int chave = arr[i];
+        int j = i - 1;
+        while (j >= low && arr[j] > chave) {
+            arr[j + 1] = arr[j];
+            j--;
+        }
+        arr[j + 1] = chave;
+    }
+}
+
+/**
+ * @brief Versão de mediana_de_tres para elementos de 64 bits
+ *
+ * @param arr Array a ser particionado
+ * @param low Índice inicial da partição
+ * @param high Índice final da partição
+ */
+void mediana_de_tres_int64(int64_t arr[], long low, long high) {
+    long meio = low + (high - low) / 2;
+    int64_t temp;
+    if (arr[meio] < arr[low]) { temp = arr[meio]; arr[meio] = arr[low]; arr[low] = temp; }
+    if (arr[high] < arr[low]) { temp = arr[high]; arr[high] = arr[low]; arr[low] = temp; }
+    if (arr[high] < arr[meio]) { temp = arr[high]; arr[high] = arr[meio]; arr[meio] = temp; }
+    temp = arr[meio]; arr[meio] = arr[high]; arr[high] = temp;
+}
+
+/**
+ * @brief Versão de partition para elementos de 64 bits
+ *
+ * O pivô é o último elemento, como em partition, mas os dois índices
+ * caminham das pontas para o centro e param em elementos iguais ao pivô
+ * (partição de Hoare). Assim, valores repetidos se dividem entre os dois
+ * lados e um array com todos os elementos iguais não degenera em O(n^2).
+ *
+ * @param arr Array a ser particionado
+ * @param low Índice inicial da partição
+ * @param high Índice final da partição (pivô)
+ * @return Posição final do pivô
+ */
+long partition_int64(int64_t arr[], long low, long high) {
+    int64_t pivot = arr[high];
+    long i = low - 1;
+    long j = high;
+
+    for (;;) {
+        while (arr[++i] < pivot);
+        while (pivot < arr[--j]) {
+            if (j == low) break;
+        }
+        if (i >= j) break;
+        int64_t temp = arr[i];
+        arr[i] = arr[j];
+        arr[j] = temp;
+    }
+    int64_t temp = arr[i];
+    arr[i] = arr[high];
+    arr[high] = temp;
+    return i;
+}
+
+/**
+ * @brief Versão do QuickSort para elementos de 64 bits
+ *
+ * Mesma proteção de quicksort_blocos: pivô pela mediana de três, recursão
+ * apenas na partição menor (pilha O(log n)) e ordenação por inserção nos
+ * trechos com até LIMIAR_INSERCAO_BLOCOS elementos.
+ *
+ * @param arr Array a ser ordenado
+ * @param low Índice inicial da partição
+ * @param high Índice final da partição
+ */
+void quicksort_int64(int64_t arr[], long low, long high) {
+    while (high - low + 1 > LIMIAR_INSERCAO_BLOCOS) {
+        mediana_de_tres_int64(arr, low, high);
+        long pi = partition_int64(arr, low, high);
+        if (pi - low < high - pi) {
+            quicksort_int64(arr, low, pi - 1);
+            low = pi + 1;
+        } else {
+            quicksort_int64(arr, pi + 1, high);
+            high = pi - 1;
+        }
+    }
+
+    for (long i = low + 1; i <= high; i++) {
+        int64_t chave = arr[i];
+        long j = i - 1;
+        while (j >= low && arr[j] > chave) {
+            arr[j + 1] = arr[j];
+            j--;
+        }
+        arr[j + 1] = chave;
+    }
+}
+
+/**
+ * @brief Ordena in-place um buffer de inteiros de 32 bits
+ *
+ * Ponto de entrada da biblioteca compartilhada. Usa quicksort_blocos, que
+ * não degenera em entradas já ordenadas nem estoura a pilha.
+ *
+ * @param arr Ponteiro para o primeiro elemento
+ * @param n Quantidade de elementos
+ * @return 0 em caso de sucesso, -1 se n passar de INT_MAX
+ */
+int quicksort_ordenar_int32(int32_t* arr, size_t n) {
+    if (n > (size_t)INT_MAX) {
+        return -1;
+    }
+    if (n > 1) {
+        quicksort_blocos(arr, 0, (int)n - 1);
+    }
+    return 0;
+}
+
+/**
+ * @brief Ordena in-place um buffer de inteiros de 64 bits
+ *
+ * Ponto de entrada da biblioteca compartilhada.
+ *
+ * @param arr Ponteiro para o primeiro elemento
+ * @param n Quantidade de elementos
+ * @return 0 em caso de sucesso, -1 se n passar de LONG_MAX
+ */
+int quicksort_ordenar_int64(int64_t* arr, size_t n) {
+    if (n > (size_t)LONG_MAX) {
+        return -1;
+    }
+    if (n > 1) {
+        quicksort_int64(arr, 0, (long)n - 1);
+    }
+    return 0;
+}
+
+/* Bits por dígito do radix sort (2048 baldes por passada) */
+#define RADIX_BITS 11
+#define RADIX_BALDES (1 << RADIX_BITS)
+
+/* Abaixo deste tamanho o QuickSort vence os algoritmos por distribuição */
+#define LIMIAR_DISTRIBUICAO 64
+
+/* Partições muito desbalanceadas (lado maior > 7/8) toleradas pelo introselect */
+#define LIMITE_PARTICOES_RUINS 3
+
+/**
+ * @brief Obtém o menor e o maior valor do array em uma única passagem
+ *
+ * @param arr Array analisado (deve ter ao menos um elemento)
+ * @param n Quantidade de elementos
+ * @param minimo Recebe o menor valor
+ * @param maximo Recebe o maior valor
+ */
+void obter_intervalo(const int arr[], int n, int* minimo, int* maximo) {
+    int menor = arr[0];
+    int maior = arr[0];
+    for (int i = 1; i < n; i++) {
+        if (arr[i] < menor) menor = arr[i];
+        if (arr[i] > maior) maior = arr[i];
+    }
+    *minimo = menor;
+    *maximo = maior;
+}
+
+/**
+ * @brief Ordena o array por contagem (counting sort)
+ *
+ * Indicado para domínios densos: custo O(n + k), onde k = maximo - minimo + 1.
+ *
+ * @param arr Array a ser ordenado
+ * @param n Quantidade de elementos
+ * @param minimo Menor valor do array
+ * @param maximo Maior valor do array
+ */
+void counting_sort(int arr[], int n, int minimo, int maximo) {
+    size_t k = (size_t)((int64_t)maximo - minimo) + 1;
+    int* contagem = (int*)calloc(k, sizeof(int));
+    if (contagem == NULL) {
+        printf("Erro: falha na alocação de memória\n");
+        exit(1);
+    }
+
+    for (int i = 0; i < n; i++) {
+        contagem[(uint32_t)arr[i] - (uint32_t)minimo]++;
+    }
+
+    int pos = 0;
+    for (size_t v = 0; v < k; v++) {
+        int valor = (int)((uint32_t)minimo + (uint32_t)v);
+        for (int c = contagem[v]; c > 0; c--) {
+            arr[pos++] = valor;
+        }
+    }
+    free(contagem);
+}
+
+/**
+ * @brief Ordena o array com radix sort LSD de 11 bits por dígito
+ *
+ * As chaves são deslocadas pelo mínimo, de forma que valores negativos são
+ * tratados corretamente e o número de passadas depende apenas da amplitude
+ * (duas passadas para amplitudes de até 2^22).
+ *
+ * @param arr Array a ser ordenado
+ * @param n Quantidade de elementos
+ * @param minimo Menor valor do array
+ * @param maximo Maior valor do array
+ */
+void radix_sort(int arr[], int n, int minimo, int maximo) {
+    uint32_t amplitude = (uint32_t)maximo - (uint32_t)minimo;
+    int* auxiliar = (int*)malloc((size_t)n * sizeof(int));
+    if (auxiliar == NULL) {
+        printf("Erro: falha na alocação de memória\n");
+        exit(1);
+    }
+
+    int* origem = arr;
+    int* destino = auxiliar;
+    for (int deslocamento = 0; deslocamento < 32 && (amplitude >> deslocamento) != 0;
+         deslocamento += RADIX_BITS) {
+        size_t contagem[RADIX_BALDES] = {0};
+        for (int i = 0; i < n; i++) {
+            uint32_t chave = (uint32_t)origem[i] - (uint32_t)minimo;
+            contagem[(chave >> deslocamento) & (RADIX_BALDES - 1)]++;
+        }
+
+        size_t soma = 0;
+        for (int b = 0; b < RADIX_BALDES; b++) {
+            size_t c = contagem[b];
+            contagem[b] = soma;
+            soma += c;
+        }
+
+        for (int i = 0; i < n; i++) {
+            uint32_t chave = (uint32_t)origem[i] - (uint32_t)minimo;
+            destino[contagem[(chave >> deslocamento) & (RADIX_BALDES - 1)]++] = origem[i];
+        }
+
+        int* temp = origem;
+        origem = destino;
+        destino = temp;
+    }
+
+    if (origem != arr) {
+        memcpy(arr, origem, (size_t)n * sizeof(int));
+    }
+    free(auxiliar);
+}
+
+/**
+ * @brief Escolhe o algoritmo de ordenação a partir do tamanho e do intervalo
+ *
+ * - Entradas pequenas: quicksort
+ * - Domínio denso (amplitude até n/2): counting sort, cujo vetor de contagem
+ *   ainda cabe bem em cache
+ * - Demais casos: radix sort
+ *
+ * @param n Quantidade de elementos
+ * @param minimo Menor valor do array
+ * @param maximo Maior valor do array
+ * @return Nome do algoritmo ("quicksort", "counting" ou "radix")
+ */
+const char* escolher_algoritmo(int n, int minimo, int maximo) {
+    if (n < LIMIAR_DISTRIBUICAO) {
+        return "quicksort";
+    }
+    uint32_t amplitude = (uint32_t)maximo - (uint32_t)minimo;
+    if (2 * (uint64_t)amplitude <= (uint64_t)n) {
+        return "counting";
+    }
+    return "radix";
+}
+
+/**
+ * @brief Verifica se o modo pedido é de seleção (nth, topk, topk-ordenado, quantis)
+ */
+static int eh_selecao(const char* modo) {
+    return strcmp(modo, "nth") == 0 || strcmp(modo, "topk") == 0 ||
+           strcmp(modo, "topk-ordenado") == 0 || strcmp(modo, "quantis") == 0;
+}
+
+/**
+ * @brief Retorna o nome de exibição do algoritmo usado nos tempos impressos
+ */
+const char* nome_algoritmo(const char* algoritmo) {
+    if (strcmp(algoritmo, "radix") == 0) return "Radix Sort";
+    if (strcmp(algoritmo, "counting") == 0) return "Counting Sort";
+    if (strcmp(algoritmo, "blocos") == 0) return "BlockQuicksort";
+    if (eh_selecao(algoritmo)) return "Quickselect";
+    return "QuickSort";
+}
+
+/**
+ * @brief Ordena o array com o algoritmo indicado
+ *
+ * @param arr Array a ser ordenado
+ * @param n Quantidade de elementos
+ * @param algoritmo "quicksort", "blocos", "radix" ou "counting"
+ */
+void ordenar(int arr[], int n, const char* algoritmo) {
+    if (n < 2) {
+        return;
+    }
+    if (strcmp(algoritmo, "quicksort") == 0) {
+        quicksort(arr, 0, n - 1);
+        return;
+    }
+    if (strcmp(algoritmo, "blocos") == 0) {
+        quicksort_blocos(arr, 0, n - 1);
+        return;
+    }
+
+    int minimo, maximo;
+    obter_intervalo(arr, n, &minimo, &maximo);
+    if (strcmp(algoritmo, "counting") == 0) {
+        counting_sort(arr, n, minimo, maximo);
+    } else {
+        radix_sort(arr, n, minimo, maximo);
+    }
+}
+
+/**
+ * @brief Ordena o array com o algoritmo indicado por escolher_algoritmo
+ *
+ * @param arr Array a ser ordenado
+ * @param n Quantidade de elementos
+ */
+void ordenar_automatico(int arr[], int n) {
+    if (n < 2) {
+        return;
+    }
+    int minimo, maximo;
+    obter_intervalo(arr, n, &minimo, &maximo);
+    ordenar(arr, n, escolher_algoritmo(n, minimo, maximo));
+}
+
+/**
+ * @brief Coloca a mediana de arr[low], arr[meio] e arr[high] na posição high
+ *
+ * Assim partition, que usa o último elemento como pivô, passa a particionar
+ * pela mediana de três, evitando o pior caso em entradas já ordenadas.
+ *
+ * @param arr Array a ser particionado
+ * @param low Índice inicial da partição
+ * @param high Índice final da partição
+ */
+void mediana_de_tres(int arr[], int low, int high) {
+    int meio = low + (high - low) / 2;
+    if (arr[meio] < arr[low]) trocar(&arr[meio], &arr[low]);
+    if (arr[high] < arr[low]) trocar(&arr[high], &arr[low]);
+    if (arr[high] < arr[meio]) trocar(&arr[high], &arr[meio]);
+    trocar(&arr[meio], &arr[high]);
+}
+
+/**
+ * @brief Seleciona o k-ésimo menor elemento (introselect)
+ *
+ * Quickselect com pivô pela mediana de três sobre a mesma função partition
+ * do QuickSort. Ao final, arr[k] contém o elemento que estaria na posição k
+ * do array ordenado, com elementos menores ou iguais à esquerda e maiores ou
+ * iguais à direita. Se a profundidade passar de 2*log2(n) ou houver mais de
+ * LIMITE_PARTICOES_RUINS partições desbalanceadas (típico de muitos valores
+ * repetidos), o trecho restante é ordenado com ordenar_automatico
+ * (radix/counting), limitando o pior caso.
+ *
+ * @param arr Array
+ * @param low Índice inicial do trecho
+ * @param high Índice final do trecho
+ * @param k Posição desejada (low <= k <= high)
+ */
+void introselect(int arr[], int low, int high, int k) {
+    int limite = 0;
+    for (int tamanho = high - low + 1; tamanho > 1; tamanho >>= 1) {
+        limite += 2;
+    }
+
+    int ruins = 0;
+    while (low < high) {
+        if (limite-- == 0 || ruins > LIMITE_PARTICOES_RUINS) {
+            ordenar_automatico(arr + low, high - low + 1);
+            return;
+        }
+        if (high - low >= 2) {
+            mediana_de_tres(arr, low, high);
+        }
+        int pi = partition(arr, low, high);
+        int maior_lado = (pi - low > high - pi) ? pi - low : high - pi;
+        if (8 * (int64_t)maior_lado > 7 * (int64_t)(high - low + 1)) {
+            ruins++;
+        }
+        if (k == pi) {
+            return;
+        } else if (k < pi) {
+            high = pi - 1;
+        } else {
+            low = pi + 1;
+        }
+    }
+}
+
+/**
+ * @brief Seleciona várias posições de uma vez (multisseleção)
+ *
+ * Seleciona a posição do meio e resolve recursivamente as posições menores
+ * no trecho da esquerda e as maiores no da direita: O(n log r) para r posições.
+ *
+ * @param arr Array
+ * @param low Índice inicial do trecho
+ * @param high Índice final do trecho
+ * @param ranks Posições desejadas, em ordem crescente, dentro de [low, high]
+ * @param nr Quantidade de posições
+ */
+void selecionar_varios(int arr[], int low, int high, const int ranks[], int nr) {
+    if (nr == 0 || low >= high) {
+        return;
+    }
+    int meio = nr / 2;
+    int k = ranks[meio];
+    introselect(arr, low, high, k);
+
+    int fim_esquerda = meio;
+    while (fim_esquerda > 0 && ranks[fim_esquerda - 1] == k) fim_esquerda--;
+    int inicio_direita = meio + 1;
+    while (inicio_direita < nr && ranks[inicio_direita] == k) inicio_direita++;
+
+    selecionar_varios(arr, low, k - 1, ranks, fim_esquerda);
+    selecionar_varios(arr, k + 1, high, ranks + inicio_direita, nr - inicio_direita);
+}
+
+/**
+ * @brief Retorna o k-ésimo menor elemento (k a partir de 0)
+ *
+ * O array é reorganizado como em introselect.
+ *
+ * @param arr Array
+ * @param n Quantidade de elementos
+ * @param k Posição desejada (0 <= k < n)
+ * @return Elemento que ocupa a posição k no array ordenado
+ */
+int nth_elemento(int arr[], int n, int k) {
+    introselect(arr, 0, n - 1, k);
+    return arr[k];
+}
+
+/**
+ * @brief Move os k menores elementos para arr[0..k-1]
+ *
+ * @param arr Array
+ * @param n Quantidade de elementos
+ * @param k Quantidade de elementos desejada (1 <= k <= n)
+ * @param ordenado Se diferente de zero, os k elementos também são ordenados
+ */
+void menores_k(int arr[], int n, int k, int ordenado) {
+    if (k < n) {
+        introselect(arr, 0, n - 1, k - 1);
+    }
+    if (ordenado) {
+        ordenar_automatico(arr, k);
+    }
+}
+
+/**
+ * @brief Calcula vários quantis com uma única multisseleção
+ *
+ * O quantil q corresponde à posição floor(q * (n - 1)) do array ordenado.
+ *
+ * @param arr Array (é reorganizado)
+ * @param n Quantidade de elementos
+ * @param qs Quantis desejados, cada um em [0, 1], em qualquer ordem
+ * @param nq Quantidade de quantis
+ * @param saida Recebe o valor de cada quantil, na ordem de qs
+ */
+void quantis(int arr[], int n, const double qs[], int nq, int saida[]) {
+    if (nq <= 0) {
+        return;
+    }
+    int* ranks = (int*)malloc((size_t)nq * sizeof(int));
+    if (ranks == NULL) {
+        printf("Erro: falha na alocação de memória\n");
+        exit(1);
+    }
+    for (int i = 0; i < nq; i++) {
+        ranks[i] = (int)(qs[i] * (n - 1));
+    }
+    quicksort(ranks, 0, nq - 1);
+    selecionar_varios(arr, 0, n - 1, ranks, nq);
+    for (int i = 0; i < nq; i++) {
+        saida[i] = arr[(int)(qs[i] * (n - 1))];
+    }
+    free(ranks);
+}
+
 /**
  * @brief Gera um caminho completo para o arquivo
  *
@@ -91,29 +713,114 @@ char* gerar_caminho(const char* diretorio, const char* arquivo) {
 }
 
 /**
- * @brief Conta o número de elementos no arquivo
+ * @brief Verifica se o caractere é um espaço em branco aceito na entrada
+ */
+static int eh_espaco(char c) {
+    return c == ' ' || c == '\t' || c == '\n' || c == '\r';
+}
+
+/**
+ * @brief Lê os números do arquivo de entrada em uma única passagem
+ *
+ * O arquivo é mapeado em memória com mmap e os inteiros são convertidos
+ * diretamente por um laço de dígitos, sem contagem prévia nem fscanf.
+ * O array é dimensionado a partir do tamanho do arquivo (cada número ocupa
+ * ao menos dois bytes contando a vírgula) e ajustado ao final.
+ * Espaços em branco entre os números e quebras de linha finais são aceitos.
  *
- * @param filename Nome do arquivo (deve estar no diretório input/)
- * @return Número de elementos no arquivo
+ * @param caminho Caminho completo do arquivo de entrada
+ * @param quantidade Recebe o número de elementos lidos
+ * @return Array com os números (deve ser liberado com free) ou NULL em caso de erro
  */
-int contar_numeros(const char* filename) {
-    char* caminho = gerar_caminho("input", filename);
-    FILE* file = fopen(caminho, "r");
-    if (file == NULL) {
+int* ler_numeros(const char* caminho, int* quantidade) {
+    int fd = open(caminho, O_RDONLY);
+    if (fd < 0) {
         printf("Erro: não foi possível abrir o arquivo '%s'\n", caminho);
-        free(caminho);
-        exit(1);
+        return NULL;
     }
 
-    int count = 1;  // Começa com 1 para o primeiro número
-    char c;
-    while ((c = fgetc(file)) != EOF) {
-        if (c == ',') count++;
+    struct stat info;
+    if (fstat(fd, &info) < 0 || info.st_size == 0) {
+        printf("Erro: formato inválido no arquivo de entrada\n");
+        close(fd);
+        return NULL;
     }
+    size_t tamanho = (size_t)info.st_size;
 
-    fclose(file);
-    free(caminho);
-    return count;
+    const char* dados = mmap(NULL, tamanho, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (dados == MAP_FAILED) {
+        printf("Erro: falha ao mapear o arquivo '%s'\n", caminho);
+        return NULL;
+    }
+    madvise((void*)dados, tamanho, MADV_SEQUENTIAL);
+
+    size_t capacidade = tamanho / 2 + 1;
+    int* numeros = (int*)malloc(capacidade * sizeof(int));
+    if (numeros == NULL) {
+        printf("Erro: falha na alocação de memória\n");
+        munmap((void*)dados, tamanho);
+        return NULL;
+    }
+
+    const char* p = dados;
+    const char* fim = dados + tamanho;
+    size_t n = 0;
+    int valido = 1;
+
+    while (1) {
+        while (p < fim && eh_espaco(*p)) p++;
+
+        int negativo = 0;
+        if (p < fim && (*p == '-' || *p == '+')) {
+            negativo = (*p == '-');
+            p++;
+        }
+        if (p >= fim || *p < '0' || *p > '9') {
+            valido = 0;
+            break;
+        }
+
+        long long valor = 0;
+        while (p < fim && *p >= '0' && *p <= '9') {
+            valor = valor * 10 + (*p - '0');
+            if (valor > 2147483648LL) {
+                valido = 0;
+                break;
+            }
+            p++;
+        }
+        if (!valido) break;
+        if (negativo) valor = -valor;
+        if (valor > 2147483647LL) {
+            valido = 0;
+            break;
+        }
+        numeros[n++] = (int)valor;
+
+        while (p < fim && eh_espaco(*p)) p++;
+        if (p >= fim) break;
+        if (*p != ',') {
+            valido = 0;
+            break;
+        }
+        p++;
+    }
+
+    munmap((void*)dados, tamanho);
+
+    if (!valido || n > 2147483647u) {
+        printf("Erro: formato inválido no arquivo de entrada\n");
+        free(numeros);
+        return NULL;
+    }
+
+    int* ajustado = (int*)realloc(numeros, n * sizeof(int));
+    if (ajustado != NULL) {
+        numeros = ajustado;
+    }
+    *quantidade = (int)n;
+    return numeros;
 }
 
 /**
@@ -157,7 +864,7 @@ char* gerar_nome_saida(const char* nome_entrada) {
  * Fluxo de execução:
  * 1. Lê argumentos da linha de comando
  * 2. Lê números do arquivo de entrada
- * 3. Ordena os números usando QuickSort
+ * 3. Ordena os números (QuickSort por padrão, ou radix/counting/auto)
  * 4. Salva o resultado em arquivo
  * 5. Mostra estatísticas de tempo
  *
@@ -165,12 +872,31 @@ char* gerar_nome_saida(const char* nome_entrada) {
  * @param argv Array de argumentos
  * @return 0 em caso de sucesso, 1 em caso de erro
  */
+#ifndef QUICKSORT_BIBLIOTECA
 int main(int argc, char *argv[]) {
     if (argc < 2) {
-        printf("Uso: %s <arquivo_entrada>\n", argv[0]);
+        printf("Uso: %s <arquivo_entrada> [algoritmo]\n", argv[0]);
+        printf("     %s <arquivo_entrada> nth|topk|topk-ordenado <k>\n", argv[0]);
+        printf("     %s <arquivo_entrada> quantis <q1,q2,...>\n", argv[0]);
         printf("Exemplo: %s numeros.txt\n", argv[0]);
         printf("O arquivo deve estar no diretório 'input'\n");
         printf("O resultado será salvo no diretório 'output'\n");
+        printf("Algoritmos: quicksort (padrão), blocos (BlockQuicksort), radix, counting ou auto\n");
+        printf("Seleção: nth (k-ésimo menor, a partir de 0), topk (k menores),\n");
+        printf("         topk-ordenado (k menores ordenados) ou quantis (valores em [0, 1])\n");
+        return 1;
+    }
+
+    const char* algoritmo = argc > 2 ? argv[2] : "quicksort";
+    int selecao = eh_selecao(algoritmo);
+    if (strcmp(algoritmo, "quicksort") != 0 && strcmp(algoritmo, "blocos") != 0 &&
+        strcmp(algoritmo, "radix") != 0 &&
+        strcmp(algoritmo, "counting") != 0 && strcmp(algoritmo, "auto") != 0 && !selecao) {
+        printf("Erro: algoritmo '%s' desconhecido\n", algoritmo);
+        return 1;
+    }
+    if (selecao && argc < 4) {
+        printf("Erro: o modo '%s' exige um parâmetro\n", algoritmo);
         return 1;
     }
 
@@ -184,19 +910,54 @@ int main(int argc, char *argv[]) {
     // Mede tempo de leitura
     tempo_inicio = obter_tempo_ms();
     
-    int n = contar_numeros(arquivo_entrada);
-    int* numeros = (int*)malloc(n * sizeof(int));
+    int n = 0;
+    int* numeros = ler_numeros(caminho_entrada, &n);
     if (numeros == NULL) {
-        printf("Erro: falha na alocação de memória\n");
         free(arquivo_saida);
         free(caminho_entrada);
         free(caminho_saida);
         return 1;
     }
+    
+    tempo_leitura = obter_tempo_ms() - tempo_inicio;
 
-    FILE* file = fopen(caminho_entrada, "r");
-    if (file == NULL) {
-        printf("Erro: arquivo '%s' não encontrado no diretório 'input'\n", arquivo_entrada);
+    // Valida o parâmetro dos modos de seleção
+    long k = 0;
+    int nq = 0;
+    double* qs = NULL;
+    int parametro_valido = 1;
+    if (selecao && strcmp(algoritmo, "quantis") == 0) {
+        nq = 1;
+        for (const char* c = argv[3]; *c; c++) {
+            if (*c == ',') nq++;
+        }
+        qs = (double*)malloc((size_t)nq * sizeof(double));
+        const char* p = argv[3];
+        for (int i = 0; qs != NULL && i < nq; i++) {
+            char* fim;
+            qs[i] = strtod(p, &fim);
+            if (fim == p || (*fim != ',' && *fim != '\0') || !(qs[i] >= 0.0 && qs[i] <= 1.0)) {
+                free(qs);
+                qs = NULL;
+                break;
+            }
+            p = fim + 1;
+        }
+        if (qs == NULL) {
+            parametro_valido = 0;
+            printf("Erro: quantis inválidos '%s' (use valores em [0, 1] separados por vírgula)\n", argv[3]);
+        }
+    } else if (selecao) {
+        char* fim;
+        k = strtol(argv[3], &fim, 10);
+        long minimo_k = strcmp(algoritmo, "nth") == 0 ? 0 : 1;
+        long maximo_k = strcmp(algoritmo, "nth") == 0 ? n - 1 : n;
+        if (*argv[3] == '\0' || *fim != '\0' || k < minimo_k || k > maximo_k) {
+            parametro_valido = 0;
+            printf("Erro: k inválido '%s' (deve estar entre %ld e %ld)\n", argv[3], minimo_k, maximo_k);
+        }
+    }
+    if (!parametro_valido) {
         free(numeros);
         free(arquivo_saida);
         free(caminho_entrada);
@@ -204,35 +965,48 @@ int main(int argc, char *argv[]) {
         return 1;
     }
 
-    for (int i = 0; i < n; i++) {
-        if (fscanf(file, "%d", &numeros[i]) != 1) {
-            printf("Erro: formato inválido no arquivo de entrada\n");
-            fclose(file);
-            free(numeros);
-            free(arquivo_saida);
-            free(caminho_entrada);
-            free(caminho_saida);
-            return 1;
-        }
-        if (i < n-1) {
-            fgetc(file); // Pula a vírgula
-        }
-    }
-    fclose(file);
-    
-    tempo_leitura = obter_tempo_ms() - tempo_inicio;
-
     // Mede tempo do algoritmo
     tempo_inicio = obter_tempo_ms();
-    quicksort(numeros, 0, n - 1);
+    const int* saida = numeros;
+    int m = n;
+    int* valores_quantis = NULL;
+    int automatico = strcmp(algoritmo, "auto") == 0;
+    int minimo = 0, maximo = 0;
+    if (automatico && n > 0) {
+        obter_intervalo(numeros, n, &minimo, &maximo);
+        algoritmo = escolher_algoritmo(n, minimo, maximo);
+    } else if (automatico) {
+        algoritmo = "quicksort";
+    }
+    if (strcmp(algoritmo, "nth") == 0) {
+        nth_elemento(numeros, n, (int)k);
+        saida = &numeros[k];
+        m = 1;
+    } else if (strcmp(algoritmo, "topk") == 0 || strcmp(algoritmo, "topk-ordenado") == 0) {
+        menores_k(numeros, n, (int)k, strcmp(algoritmo, "topk-ordenado") == 0);
+        m = (int)k;
+    } else if (strcmp(algoritmo, "quantis") == 0) {
+        valores_quantis = (int*)malloc((size_t)nq * sizeof(int));
+        if (valores_quantis == NULL) {
+            printf("Erro: falha na alocação de memória\n");
+            exit(1);
+        }
+        quantis(numeros, n, qs, nq, valores_quantis);
+        saida = valores_quantis;
+        m = nq;
+    } else {
+        ordenar(numeros, n, algoritmo);
+    }
     tempo_algoritmo = obter_tempo_ms() - tempo_inicio;
 
     // Mede tempo de escrita
     tempo_inicio = obter_tempo_ms();
     
-    file = fopen(caminho_saida, "w");
+    FILE* file = fopen(caminho_saida, "w");
     if (file == NULL) {
         printf("Erro: não foi possível criar o arquivo em 'output/%s'\n", arquivo_saida);
+        free(qs);
+        free(valores_quantis);
         free(numeros);
         free(arquivo_saida);
         free(caminho_entrada);
@@ -240,9 +1014,9 @@ int main(int argc, char *argv[]) {
         return 1;
     }
 
-    for (int i = 0; i < n; i++) {
-        fprintf(file, "%d", numeros[i]);
-        if (i < n-1) {
+    for (int i = 0; i < m; i++) {
+        fprintf(file, "%d", saida[i]);
+        if (i < m-1) {
             fprintf(file, ",");
         }
     }
@@ -254,14 +1028,21 @@ int main(int argc, char *argv[]) {
     // Imprime os resultados
     printf("\nTempos de execução (C):\n");
     printf("Leitura do arquivo: %.3f ms\n", tempo_leitura);
-    printf("Algoritmo QuickSort: %.3f ms\n", tempo_algoritmo);
+    printf("Algoritmo %s: %.3f ms\n", nome_algoritmo(algoritmo), tempo_algoritmo);
     printf("Escrita do arquivo: %.3f ms\n", tempo_escrita);
     printf("Tempo total: %.3f ms\n", tempo_total);
-    printf("\nOrdenação concluída. Resultado salvo em 'output/%s'\n", arquivo_saida);
+    if (automatico) {
+        printf("Algoritmo escolhido: %s (intervalo [%d, %d])\n", algoritmo, minimo, maximo);
+    }
+    printf("\n%s concluída. Resultado salvo em 'output/%s'\n",
+           selecao ? "Seleção" : "Ordenação", arquivo_saida);
 
+    free(qs);
+    free(valores_quantis);
     free(numeros);
     free(arquivo_saida);
     free(caminho_entrada);
     free(caminho_saida);
     return 0;
-} 
\ No newline at end of file
+}
+#endif
@@ -4,11 +4,58 @@ Implementação do algoritmo QuickSort em Python.
 
 Este módulo implementa o algoritmo de ordenação QuickSort de forma equivalente
 à implementação em C.
+
+Além da implementação em Python puro, o módulo oferece o backend 'c', que chama
+a biblioteca compartilhada libquicksort.so (gerada com `make`) via ctypes,
+ordenando in-place e sem cópia o buffer de um array.array ou numpy.ndarray.
 """
 
 import sys
 import time
 import os
+import ctypes
+import heapq
+import math
+import operator
+from array import array
+from collections import Counter
+from itertools import chain, compress, islice, repeat
+
+BIBLIOTECA_C = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libquicksort.so')
+_biblioteca = None
+# Índices da versão int32 em C são int: no máximo INT_MAX elementos
+LIMITE_ELEMENTOS_INT32 = 2**31 - 1
+
+# Bits por dígito do radix sort (2048 baldes por passada)
+RADIX_BITS = 11
+# Abaixo deste tamanho o QuickSort vence os algoritmos por distribuição
+LIMIAR_DISTRIBUICAO = 64
+
+# Até este tamanho a ordenação por inserção é sempre usada pelo despachante
+LIMIAR_INSERCAO = 32
+# Acima deste tamanho a inserção só é tentada com até n/64 descidas e desiste
+# após n/32 deslocamentos (desordem esparsa, mas com elementos distantes)
+FRACAO_DESCIDAS_INSERCAO = 64
+FRACAO_DESLOCAMENTOS_INSERCAO = 32
+# Até este número de corridas a intercalação vence os demais algoritmos
+LIMIAR_CORRIDAS = 8
+# Partições muito desbalanceadas (lado maior > 7/8) toleradas pelo introselect
+LIMITE_PARTICOES_RUINS = 3
+
+BACKENDS = ('python', 'c', 'radix', 'counting', 'auto', 'adaptativo')
+MODOS_SELECAO = ('nth', 'topk', 'topk-ordenado', 'quantis')
+NOMES_ALGORITMOS = {
+    'nth': 'Quickselect',
+    'topk': 'Quickselect',
+    'topk-ordenado': 'Quickselect',
+    'quantis': 'Quickselect',
+    'adaptativo': 'Adaptativo',
+    'python': 'QuickSort',
+    'c': 'QuickSort',
+    'quicksort': 'QuickSort',
+    'radix': 'Radix Sort',
+    'counting': 'Counting Sort',
+}
 
 def trocar(arr: list, i: int, j: int) -> None:
     """
@@ -67,6 +114,473 @@ def quicksort(arr: list, low: int, high: int) -> None:
         quicksort(arr, low, pi - 1)
         quicksort(arr, pi + 1, high)
 
+def carregar_biblioteca() -> ctypes.CDLL:
+    """
+    Carrega (uma única vez) a biblioteca compartilhada do QuickSort em C.
+    
+    Returns:
+        ctypes.CDLL: Biblioteca com as funções quicksort_ordenar_int32/int64
+    
+    Raises:
+        OSError: Se a biblioteca não tiver sido compilada
+    """
+    global _biblioteca
+    if _biblioteca is None:
+        if not os.path.exists(BIBLIOTECA_C):
+            raise OSError(f"Biblioteca '{BIBLIOTECA_C}' não encontrada. Execute 'make' para compilá-la")
+        biblioteca = ctypes.CDLL(BIBLIOTECA_C)
+        for nome in ('quicksort_ordenar_int32', 'quicksort_ordenar_int64'):
+            funcao = getattr(biblioteca, nome)
+            funcao.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            funcao.restype = ctypes.c_int
+        _biblioteca = biblioteca
+    return _biblioteca
+
+def quicksort_c(buffer) -> None:
+    """
+    Ordena in-place, usando a implementação em C, um buffer de inteiros.
+    
+    O buffer é repassado à biblioteca sem cópia, então deve ser contíguo,
+    gravável e conter inteiros com sinal de 32 ou 64 bits (por exemplo
+    array('i'), array('q') ou numpy.ndarray de int32/int64).
+    
+    Args:
+        buffer: Objeto que implementa o protocolo de buffer
+    
+    Raises:
+        ValueError: Se o buffer não for compatível com a biblioteca ou tiver
+            mais elementos do que a implementação em C comporta
+    """
+    visao = memoryview(buffer)
+    if visao.readonly or visao.ndim != 1 or not visao.c_contiguous:
+        raise ValueError("O buffer deve ser unidimensional, contíguo e gravável")
+    if visao.format.lstrip('@=') not in ('i', 'l', 'q') or visao.itemsize not in (4, 8):
+        raise ValueError(f"Tipo de elemento não suportado: '{visao.format}'")
+    
+    quantidade = len(visao)
+    if quantidade < 2:
+        return
+    
+    if visao.itemsize == 4 and quantidade > LIMITE_ELEMENTOS_INT32:
+        raise ValueError(f"Buffers de 32 bits aceitam no máximo {LIMITE_ELEMENTOS_INT32} elementos")
+    
+    biblioteca = carregar_biblioteca()
+    endereco = ctypes.addressof(ctypes.c_char.from_buffer(visao))
+    if visao.itemsize == 4:
+        resultado = biblioteca.quicksort_ordenar_int32(endereco, quantidade)
+    else:
+        resultado = biblioteca.quicksort_ordenar_int64(endereco, quantidade)
+    if resultado != 0:
+        raise ValueError(f"A biblioteca C recusou o buffer de {quantidade} elementos")
+
+def obter_intervalo(arr: list) -> tuple:
+    """
+    Obtém o menor e o maior valor do array.
+    
+    Args:
+        arr: Lista não vazia de inteiros
+    
+    Returns:
+        tuple: (mínimo, máximo)
+    """
+    return min(arr), max(arr)
+
+def counting_sort(arr: list, minimo: int, maximo: int) -> None:
+    """
+    Ordena o array in-place por contagem (counting sort).
+    
+    A contagem e a reconstrução são feitas por Counter, chain e repeat, que
+    iteram em C, sem laço Python por elemento.
+    
+    Args:
+        arr: Lista a ser ordenada
+        minimo: Menor valor da lista
+        maximo: Maior valor da lista
+    """
+    contagem = Counter(arr)
+    valores = range(minimo, maximo + 1)
+    arr[:] = chain.from_iterable(map(repeat, valores, map(contagem.__getitem__, valores)))
+
+def radix_sort(arr: list, minimo: int, maximo: int) -> None:
+    """
+    Ordena o array in-place com radix sort LSD de 11 bits por dígito.
+    
+    As chaves são deslocadas pelo mínimo, então valores negativos são aceitos
+    e o número de passadas depende apenas da amplitude dos valores.
+    
+    Diferente de counting_sort, a distribuição nos baldes é um laço Python
+    por elemento a cada passada, mantido para não depender do numpy: as
+    alternativas só com a biblioteca padrão (ordenar índices pelo dígito com
+    sorted) mediram 2 a 3 vezes mais lentas em 1M de chaves.
+    
+    Args:
+        arr: Lista a ser ordenada
+        minimo: Menor valor da lista
+        maximo: Maior valor da lista
+    """
+    amplitude = maximo - minimo
+    mascara = (1 << RADIX_BITS) - 1
+    atual = arr
+    deslocamento = 0
+    while amplitude >> deslocamento:
+        baldes = [[] for _ in range(mascara + 1)]
+        anexar = [balde.append for balde in baldes]
+        for x in atual:
+            anexar[((x - minimo) >> deslocamento) & mascara](x)
+        atual = list(chain.from_iterable(baldes))
+        deslocamento += RADIX_BITS
+    if atual is not arr:
+        arr[:] = atual
+
+def escolher_algoritmo(n: int, minimo: int, maximo: int) -> str:
+    """
+    Escolhe o algoritmo de ordenação a partir do tamanho e do intervalo.
+    
+    Mesma regra da implementação em C:
+    - Entradas pequenas: quicksort
+    - Domínio denso (amplitude até n/2): counting sort
+    - Demais casos: radix sort
+    
+    Args:
+        n: Quantidade de elementos
+        minimo: Menor valor
+        maximo: Maior valor
+    
+    Returns:
+        str: 'quicksort', 'counting' ou 'radix'
+    """
+    if n < LIMIAR_DISTRIBUICAO:
+        return 'quicksort'
+    if 2 * (maximo - minimo) <= n:
+        return 'counting'
+    return 'radix'
+
+def ordenar(arr: list, algoritmo: str) -> None:
+    """
+    Ordena o array in-place com o algoritmo indicado.
+    
+    Args:
+        arr: Lista a ser ordenada
+        algoritmo: 'quicksort', 'radix' ou 'counting'
+    """
+    if len(arr) < 2:
+        return
+    if algoritmo == 'quicksort':
+        quicksort(arr, 0, len(arr) - 1)
+        return
+    minimo, maximo = obter_intervalo(arr)
+    if algoritmo == 'counting':
+        counting_sort(arr, minimo, maximo)
+    else:
+        radix_sort(arr, minimo, maximo)
+
+def sondar_ordenacao(arr: list) -> dict:
+    """
+    Mede o quanto o array já está ordenado, sem modificá-lo.
+    
+    Cada medida é uma passagem linear, feita em C via map/operator:
+    
+    - descidas entre vizinhos, que delimitam as corridas crescentes
+    - inversões estimadas a partir dos pares à distância isqrt(n) fora de
+      ordem: a fração desses pares, aplicada aos n(n-1)/2 pares do array
+      (exata para arrays ordenados e invertidos, n²/4 para aleatórios)
+    - duplicatas: fração de pares de vizinhos iguais
+    
+    Só as descidas e corridas entram na decisão; as demais são informativas.
+    
+    Args:
+        arr: Lista de números
+    
+    Returns:
+        dict: n, corridas, descidas, inversoes (estimativa) e duplicatas
+    """
+    n = len(arr)
+    if n < 2:
+        return {'n': n, 'corridas': n, 'descidas': 0, 'inversoes': 0, 'duplicatas': 0.0}
+    descidas = sum(map(operator.gt, arr, islice(arr, 1, None)))
+    iguais = sum(map(operator.eq, arr, islice(arr, 1, None)))
+    distancia = math.isqrt(n)
+    fora_de_ordem = sum(map(operator.gt, arr, islice(arr, distancia, None)))
+    inversoes = fora_de_ordem * n * (n - 1) // (2 * (n - distancia))
+    return {'n': n, 'corridas': descidas + 1, 'descidas': descidas,
+            'inversoes': inversoes, 'duplicatas': iguais / (n - 1)}
+
+def insertion_sort(arr: list, limite: int = -1) -> bool:
+    """
+    Ordena o array in-place por inserção.
+    
+    Custo O(n + inversões): adequado para arrays pequenos ou quase ordenados.
+    Com um limite de deslocamentos, desiste ao ultrapassá-lo, deixando o array
+    parcialmente ordenado (mas com os mesmos elementos).
+    
+    Args:
+        arr: Lista a ser ordenada
+        limite: Máximo de deslocamentos permitidos (negativo = sem limite)
+    
+    Returns:
+        bool: True se o array foi totalmente ordenado
+    """
+    deslocamentos = 0
+    for i in range(1, len(arr)):
+        chave = arr[i]
+        j = i - 1
+        while j >= 0 and arr[j] > chave:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = chave
+        deslocamentos += i - 1 - j
+        if 0 <= limite < deslocamentos:
+            return False
+    return True
+
+def natural_merge_sort(arr: list) -> None:
+    """
+    Ordena o array in-place intercalando as corridas crescentes já existentes.
+    
+    As corridas são intercaladas de uma só vez com heapq.merge, com custo
+    O(n log r), onde r é o número de corridas.
+    
+    Args:
+        arr: Lista a ser ordenada
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    descidas = map(operator.gt, arr, islice(arr, 1, None))
+    inicios = [0, *compress(range(1, n), descidas), n]
+    corridas = [arr[inicios[k]:inicios[k + 1]] for k in range(len(inicios) - 1)]
+    arr[:] = heapq.merge(*corridas)
+
+def escolher_estrategia(sonda: dict) -> str:
+    """
+    Escolhe a estratégia de ordenação a partir do resultado da sonda.
+    
+    - Uma corrida: já ordenado, nada a fazer
+    - Estritamente decrescente: inversão do array
+    - Pequeno ou com até n/FRACAO_DESCIDAS_INSERCAO descidas: ordenação por inserção
+    - Até LIMIAR_CORRIDAS corridas: natural merge sort
+    - Demais casos: escolha automática entre quicksort, counting e radix
+    
+    Args:
+        sonda: Resultado de sondar_ordenacao
+    
+    Returns:
+        str: 'nenhuma', 'inversao', 'insercao', 'merge' ou 'auto'
+    """
+    n = sonda['n']
+    if sonda['corridas'] <= 1:
+        return 'nenhuma'
+    if sonda['descidas'] == n - 1:
+        return 'inversao'
+    if n <= LIMIAR_INSERCAO or sonda['descidas'] <= n // FRACAO_DESCIDAS_INSERCAO:
+        return 'insercao'
+    return escolher_estrategia_corridas(sonda)
+
+def escolher_estrategia_corridas(sonda: dict) -> str:
+    """
+    Escolhe entre intercalar as corridas e a escolha automática.
+    
+    Args:
+        sonda: Resultado de sondar_ordenacao
+    
+    Returns:
+        str: 'merge' (até LIMIAR_CORRIDAS corridas) ou 'auto'
+    """
+    return 'merge' if sonda['corridas'] <= LIMIAR_CORRIDAS else 'auto'
+
+def ordenar_adaptativo(arr: list) -> tuple:
+    """
+    Sonda a pré-ordenação do array e o ordena in-place com a estratégia adequada.
+    
+    Args:
+        arr: Lista a ser ordenada
+    
+    Returns:
+        tuple: (estratégia executada, resultado da sonda). Quando a estratégia é
+        'auto', o nome retornado é o algoritmo escolhido por escolher_algoritmo.
+    """
+    sonda = sondar_ordenacao(arr)
+    estrategia = escolher_estrategia(sonda)
+    if estrategia == 'inversao':
+        arr.reverse()
+        return estrategia, sonda
+    if estrategia == 'insercao':
+        # Poucas descidas não garantem poucas inversões (um elemento pode estar
+        # longe do lugar): se o orçamento estourar, decide pelas corridas
+        n = sonda['n']
+        if insertion_sort(arr, -1 if n <= LIMIAR_INSERCAO else n // FRACAO_DESLOCAMENTOS_INSERCAO):
+            return estrategia, sonda
+        estrategia = escolher_estrategia_corridas(sonda)
+        prefixo = 'insercao+'
+    else:
+        prefixo = ''
+    
+    if estrategia == 'merge':
+        natural_merge_sort(arr)
+    elif estrategia == 'auto':
+        minimo, maximo = obter_intervalo(arr)
+        estrategia = escolher_algoritmo(len(arr), minimo, maximo)
+        ordenar(arr, estrategia)
+    return prefixo + estrategia, sonda
+
+def ordenar_automatico(arr: list) -> None:
+    """
+    Ordena o array in-place com o algoritmo indicado por escolher_algoritmo.
+    
+    Args:
+        arr: Lista a ser ordenada
+    """
+    if len(arr) < 2:
+        return
+    minimo, maximo = obter_intervalo(arr)
+    ordenar(arr, escolher_algoritmo(len(arr), minimo, maximo))
+
+def mediana_de_tres(arr: list, low: int, high: int) -> None:
+    """
+    Coloca a mediana de arr[low], arr[meio] e arr[high] na posição high.
+    
+    Assim partition, que usa o último elemento como pivô, passa a particionar
+    pela mediana de três, evitando o pior caso em entradas já ordenadas.
+    
+    Args:
+        arr: Lista a ser particionada
+        low: Índice inicial da partição
+        high: Índice final da partição
+    """
+    meio = low + (high - low) // 2
+    if arr[meio] < arr[low]:
+        trocar(arr, meio, low)
+    if arr[high] < arr[low]:
+        trocar(arr, high, low)
+    if arr[high] < arr[meio]:
+        trocar(arr, high, meio)
+    trocar(arr, meio, high)
+
+def introselect(arr: list, low: int, high: int, k: int) -> None:
+    """
+    Seleciona o k-ésimo menor elemento (introselect).
+    
+    Quickselect com pivô pela mediana de três sobre a mesma função partition
+    do QuickSort. Ao final, arr[k] contém o elemento que estaria na posição k
+    da lista ordenada, com elementos menores ou iguais à esquerda e maiores ou
+    iguais à direita. Se a profundidade passar de 2*log2(n) ou houver mais de
+    LIMITE_PARTICOES_RUINS partições desbalanceadas (típico de muitos valores
+    repetidos), o trecho restante é ordenado com ordenar_automatico
+    (radix/counting), limitando o pior caso.
+    
+    Args:
+        arr: Lista
+        low: Índice inicial do trecho
+        high: Índice final do trecho
+        k: Posição desejada (low <= k <= high)
+    """
+    limite = 2 * (high - low + 1).bit_length()
+    ruins = 0
+    while low < high:
+        if limite == 0 or ruins > LIMITE_PARTICOES_RUINS:
+            trecho = arr[low:high + 1]
+            ordenar_automatico(trecho)
+            arr[low:high + 1] = trecho
+            return
+        limite -= 1
+        if high - low >= 2:
+            mediana_de_tres(arr, low, high)
+        pi = partition(arr, low, high)
+        if 8 * max(pi - low, high - pi) > 7 * (high - low + 1):
+            ruins += 1
+        if k == pi:
+            return
+        elif k < pi:
+            high = pi - 1
+        else:
+            low = pi + 1
+
+def selecionar_varios(arr: list, low: int, high: int, ranks: list) -> None:
+    """
+    Seleciona várias posições de uma vez (multisseleção).
+    
+    Seleciona a posição do meio e resolve recursivamente as posições menores
+    no trecho da esquerda e as maiores no da direita: O(n log r) para r posições.
+    
+    Args:
+        arr: Lista
+        low: Índice inicial do trecho
+        high: Índice final do trecho
+        ranks: Posições desejadas, em ordem crescente, dentro de [low, high]
+    """
+    if not ranks or low >= high:
+        return
+    meio = len(ranks) // 2
+    k = ranks[meio]
+    introselect(arr, low, high, k)
+    selecionar_varios(arr, low, k - 1, [r for r in ranks[:meio] if r < k])
+    selecionar_varios(arr, k + 1, high, [r for r in ranks[meio + 1:] if r > k])
+
+def nth_elemento(arr: list, k: int) -> int:
+    """
+    Retorna o k-ésimo menor elemento (k a partir de 0), reorganizando a lista.
+    
+    Args:
+        arr: Lista
+        k: Posição desejada (0 <= k < len(arr))
+    
+    Returns:
+        int: Elemento que ocupa a posição k na lista ordenada
+    
+    Raises:
+        ValueError: Se k estiver fora do intervalo
+    """
+    if not 0 <= k < len(arr):
+        raise ValueError(f"k deve estar entre 0 e {len(arr) - 1}")
+    introselect(arr, 0, len(arr) - 1, k)
+    return arr[k]
+
+def menores_k(arr: list, k: int, ordenado: bool = False) -> list:
+    """
+    Retorna os k menores elementos, reorganizando a lista.
+    
+    Args:
+        arr: Lista
+        k: Quantidade de elementos desejada (1 <= k <= len(arr))
+        ordenado: Se True, os k elementos são retornados em ordem crescente
+    
+    Returns:
+        list: Os k menores elementos
+    
+    Raises:
+        ValueError: Se k estiver fora do intervalo
+    """
+    if not 1 <= k <= len(arr):
+        raise ValueError(f"k deve estar entre 1 e {len(arr)}")
+    if k < len(arr):
+        introselect(arr, 0, len(arr) - 1, k - 1)
+    resultado = arr[:k]
+    if ordenado:
+        ordenar_automatico(resultado)
+    return resultado
+
+def quantis(arr: list, qs: list) -> list:
+    """
+    Calcula vários quantis com uma única multisseleção, reorganizando a lista.
+    
+    O quantil q corresponde à posição floor(q * (n - 1)) da lista ordenada.
+    
+    Args:
+        arr: Lista não vazia
+        qs: Quantis desejados, cada um em [0, 1], em qualquer ordem
+    
+    Returns:
+        list: Valor de cada quantil, na ordem de qs
+    
+    Raises:
+        ValueError: Se algum quantil estiver fora de [0, 1]
+    """
+    if any(not 0 <= q <= 1 for q in qs):
+        raise ValueError("Os quantis devem estar no intervalo [0, 1]")
+    ranks = [int(q * (len(arr) - 1)) for q in qs]
+    selecionar_varios(arr, 0, len(arr) - 1, sorted(set(ranks)))
+    return [arr[r] for r in ranks]
+
 def ler_arquivo(nome_arquivo: str) -> list:
     """
     Lê números de um arquivo, separados por vírgula.
@@ -118,44 +632,89 @@ def main() -> None:
     Fluxo de execução:
     1. Verifica argumentos da linha de comando
     2. Lê números do arquivo de entrada
-    3. Ordena os números usando QuickSort
+    3. Ordena os números com o backend escolhido (QuickSort por padrão)
     4. Salva o resultado em arquivo
     5. Mostra estatísticas de tempo
     """
     if len(sys.argv) < 2:
-        print("Uso: python quicksort.py <arquivo_entrada>")
+        print("Uso: python quicksort.py <arquivo_entrada> [backend]")
+        print("     python quicksort.py <arquivo_entrada> nth|topk|topk-ordenado <k>")
+        print("     python quicksort.py <arquivo_entrada> quantis <q1,q2,...>")
         print("Exemplo: python quicksort.py numeros.txt")
         print("O arquivo deve estar no diretório 'input'")
         print("O resultado será salvo no diretório 'output'")
+        print("Backends: 'python' (padrão), 'c' (biblioteca libquicksort.so),")
+        print("          'radix', 'counting', 'auto' (escolhe pelo intervalo de valores)")
+        print("          ou 'adaptativo' (escolhe pela pré-ordenação da entrada)")
+        print("Seleção: nth (k-ésimo menor, a partir de 0), topk (k menores),")
+        print("         topk-ordenado (k menores ordenados) ou quantis (valores em [0, 1])")
         sys.exit(1)
 
     arquivo_entrada = sys.argv[1]
+    backend = sys.argv[2].lower() if len(sys.argv) > 2 else 'python'
+    if backend not in BACKENDS + MODOS_SELECAO:
+        print(f"Erro: backend '{backend}' desconhecido. Use {', '.join(BACKENDS + MODOS_SELECAO)}")
+        sys.exit(1)
+    if backend in MODOS_SELECAO and len(sys.argv) < 4:
+        print(f"Erro: o modo '{backend}' exige um parâmetro")
+        sys.exit(1)
     arquivo_saida = gerar_nome_saida(arquivo_entrada)
     
     try:
         # Mede tempo de leitura
         tempo_inicio = time.time()
         numeros = ler_arquivo(arquivo_entrada)
+        if backend == 'c':
+            numeros = array('q', numeros)
         tempo_leitura = (time.time() - tempo_inicio) * 1000  # Converte para ms
         
+        # Valida o parâmetro dos modos de seleção
+        if backend == 'quantis':
+            qs = [float(q) for q in sys.argv[3].split(',')]
+        elif backend in MODOS_SELECAO:
+            k = int(sys.argv[3])
+        
         # Mede tempo do algoritmo
         tempo_inicio = time.time()
-        quicksort(numeros, 0, len(numeros) - 1)
+        algoritmo = backend
+        resultado = numeros
+        if backend == 'auto':
+            minimo, maximo = obter_intervalo(numeros)
+            algoritmo = escolher_algoritmo(len(numeros), minimo, maximo)
+        if backend == 'c':
+            quicksort_c(numeros)
+        elif backend == 'adaptativo':
+            estrategia, sonda = ordenar_adaptativo(numeros)
+        elif backend == 'nth':
+            resultado = [nth_elemento(numeros, k)]
+        elif backend in ('topk', 'topk-ordenado'):
+            resultado = menores_k(numeros, k, ordenado=backend == 'topk-ordenado')
+        elif backend == 'quantis':
+            resultado = quantis(numeros, qs)
+        else:
+            ordenar(numeros, 'quicksort' if algoritmo == 'python' else algoritmo)
         tempo_algoritmo = (time.time() - tempo_inicio) * 1000  # Converte para ms
         
         # Mede tempo de escrita
         tempo_inicio = time.time()
-        salvar_arquivo(numeros, arquivo_saida)
+        salvar_arquivo(resultado, arquivo_saida)
         tempo_escrita = (time.time() - tempo_inicio) * 1000  # Converte para ms
         
         # Calcula e mostra os tempos
         tempo_total = tempo_leitura + tempo_algoritmo + tempo_escrita
         print(f"\nTempos de execução (Python):")
         print(f"Leitura do arquivo: {tempo_leitura:.3f} ms")
-        print(f"Algoritmo QuickSort: {tempo_algoritmo:.3f} ms")
+        print(f"Algoritmo {NOMES_ALGORITMOS[algoritmo]}: {tempo_algoritmo:.3f} ms")
         print(f"Escrita do arquivo: {tempo_escrita:.3f} ms")
         print(f"Tempo total: {tempo_total:.3f} ms")
-        print(f"\nOrdenação concluída. Resultado salvo em 'output/{arquivo_saida}'")
+        if backend == 'auto':
+            print(f"Algoritmo escolhido: {algoritmo} (intervalo [{minimo}, {maximo}])")
+        if backend == 'adaptativo':
+            print(f"Sonda de pré-ordenação: corridas={sonda['corridas']}, descidas={sonda['descidas']}, "
+                  f"inversões~{sonda['inversoes']}, duplicatas={sonda['duplicatas']:.1%}")
+            print(f"Algoritmo escolhido: {estrategia}")
+        operacao = "Seleção" if backend in MODOS_SELECAO else "Ordenação"
+        print(f"\n{operacao} concluída. Resultado salvo em 'output/{arquivo_saida}'")
         
     except FileNotFoundError:
         print(f"Erro: O arquivo '{arquivo_entrada}' não foi encontrado no diretório 'input'")